@@ -2,12 +2,14 @@ from ASFINT.Push.pushers import *
 from ASFINT.Pull.pullers import *
 from ASFINT.Transform.Processor import ASUCProcessor
 from typing import Callable
+import functools
 
 PROCESS_TYPES = {
     'ABSA': {
         'pull': pull_csv, 
         'push': push_csv, 
         'process': ASUCProcessor('ABSA'), 
+        'dtypes': None, # column -> dtype map passed to pd.read_csv (eg. {'Year Rank': 'int16'} to narrow an int column), None lets pandas infer
         'naming': {
             'raw tag': "RF", 
             'clean tag': "GF", 
@@ -30,6 +32,7 @@ PROCESS_TYPES = {
         'pull': pull_csv, 
         'push': push_csv,
         'process': ASUCProcessor('OASIS'),  
+        'dtypes': None,
         'naming': {
             'raw tag':"RF", 
             'clean tag':"GF", 
@@ -41,6 +44,7 @@ PROCESS_TYPES = {
         'pull': pull_fr,
         'push': push_csv,
         'process': ASUCProcessor('FR'),
+        'dtypes': None,
         'naming': {
             'raw tag':"RF",
             'clean tag':"GF",
@@ -51,26 +55,28 @@ PROCESS_TYPES = {
     }
 }
 
-def get_pFuncs(process_type: str, func: str) -> Callable: 
-    process_type = process_type.strip().upper()
-    if process_type in PROCESS_TYPES: 
-        fields = PROCESS_TYPES[process_type]
-        func = fields.get(func.strip().lower(), None)
-        if func is None:
-            raise ValueError(f"Inputted function '{func}' not supported, select from: '{fields.keys()}'")
-        else:
-            return func
-    else:
+@functools.lru_cache(maxsize=128)
+def _resolve_pfunc(process_type: str, func: str) -> Callable:
+    # expects already normalized keys: upper case process type, lower case function
+    if process_type not in PROCESS_TYPES:
+        raise ValueError(f"Inputted process type '{process_type}' not supported, select from: '{list(PROCESS_TYPES.keys())}'")
+    fields = PROCESS_TYPES[process_type]
+    if func not in fields:
+        raise ValueError(f"Inputted function '{func}' not supported, select from: '{fields.keys()}'")
+    return fields[func]
+
+@functools.lru_cache(maxsize=128)
+def _resolve_naming(process_type: str, tag: str):
+    # expects already normalized keys: upper case process type, lower case tag
+    if process_type not in PROCESS_TYPES:
         raise ValueError(f"Inputted process type '{process_type}' not supported, select from: '{list(PROCESS_TYPES.keys())}'")
+    fields = PROCESS_TYPES[process_type]['naming']
+    if tag not in fields:
+        raise ValueError(f"Inputted tag '{tag}' not supported, select from: '{fields.keys()}'")
+    return fields[tag]
+
+def get_pFuncs(process_type: str, func: str) -> Callable: 
+    return _resolve_pfunc(process_type.strip().upper(), func.strip().lower())
     
 def get_naming(process_type: str, tag: str):
-    process_type = process_type.strip().upper()
-    if process_type in PROCESS_TYPES: 
-        fields = PROCESS_TYPES[process_type]['naming']
-        namingConvention = fields.get(tag.strip().lower(), None)
-        if namingConvention is None:
-             raise ValueError(f"Inputted tag '{tag}' not supported, select from: '{fields.keys()}'")
-        else:
-            return namingConvention
-    else:
-        raise ValueError(f"Inputted process type '{process_type}' not supported, select from: '{list(PROCESS_TYPES.keys())}'")
\ No newline at end of file
+    return _resolve_naming(process_type.strip().upper(), tag.strip().lower())
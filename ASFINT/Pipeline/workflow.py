@@ -7,11 +7,17 @@ Handles high-level ETL for ABSA, OASIS, FR, Agenda.
 """
 
 import os
+import queue
+import threading
+from collections import deque
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 
 from ASFINT.Config.Config import get_pFuncs, get_naming  
 from ASFINT.Utility.Utils import ensure_folder
 
+_DONE = object() # sentinel marking the end of a pipeline queue
+
 
 def pull(path: str, process_type: str, reporting: bool = False):
     """
@@ -46,12 +52,18 @@ def process(files: dict, process_type: str, reporting: bool = False):
     return results
 
 
-def push(dfs: dict, path: str, process_type: str, reporting: bool = False):
+def push(dfs, path: str, process_type: str, reporting: bool = False, max_workers: int = 1):
     """
     Write cleaned DataFrames to disk using configured naming.
+    'dfs' can be a {name: DataFrame} dict or any iterable of (name, DataFrame) pairs, eg. straight from process_iter.
+    With max_workers > 1 the files are written concurrently (see push_stream).
     """
+    if max_workers > 1:
+        return push_stream(dfs, path, process_type, reporting=reporting, writers=max_workers)
     push_func = get_pFuncs(process_type, "push")
-    for fname, df in dfs.items():
+    if reporting: # once per call, not per file
+        print(f"[INFO] Pushing files for process_type={process_type} to {path}")
+    for fname, df in (dfs.items() if isinstance(dfs, dict) else dfs):
         try:
             push_func(df, fname, path)
         except Exception as e:
@@ -74,7 +86,7 @@ def run(pull_path: str, push_path: str, process_type: str, reporting: bool = Fal
 
     files = pull(pull_path, pt)
     cleaned = process(files, pt, reporting=reporting)
-    push(cleaned, push_path, pt)
+    push(cleaned, push_path, pt, reporting=reporting)
 
 def process(files: dict[str, pd.DataFrame], process_type: str, reporting=False) -> dict[str, pd.DataFrame]:
     """
@@ -83,14 +95,126 @@ def process(files: dict[str, pd.DataFrame], process_type: str, reporting=False)
 
     processor = get_pFuncs(process_type=process_type, func='process')
     df_lst, new_names = processor.dispatch(files.values(), files.keys(), reporting=reporting)
-    return dict(zip(new_names, df_lst))
+    return dict(zip(new_names, df_lst)) # callers such as Validation.check index by name; run streams pairs via process_iter instead
+
+
+def pull_iter(path: str, process_type: str, reporting: bool = False):
+    """
+    Streaming version of pull: returns a generator of (filename, raw file) pairs so only one raw file is held in memory at a time.
+    """
+    pull_func = get_pFuncs(process_type, "pull")
+    return pull_func(path, process_type, stream=True)
+
+
+def process_iter(files, process_type: str, reporting=False, max_workers: int = 1):
+    """
+    Generator version of process: dispatches one file at a time and yields (name, DataFrame) pairs as each is ready.
+    'files' can be a {name: file} dict or an iterable of (name, file) pairs (eg. from pull_iter).
+    With max_workers > 1 files are processed on a thread pool, at most max_workers in flight, and results are still yielded in input order.
+    """
+    dispatch = get_pFuncs(process_type=process_type, func='process').dispatch
+    pairs = files.items() if isinstance(files, dict) else files
+
+    def _process_one(pair):
+        name, file = pair
+        df_lst, new_names = dispatch([file], [name], reporting=reporting)
+        return zip(new_names, df_lst)
+
+    if max_workers <= 1:
+        for pair in pairs:
+            yield from _process_one(pair)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = deque()
+        for pair in pairs:
+            pending.append(pool.submit(_process_one, pair))
+            if len(pending) >= max_workers: # bounds how many raw files are held at once
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _background(pairs, maxsize: int = 4):
+    """
+    Drains the 'pairs' iterator on its own thread into a bounded queue and yields from that queue,
+    so producing the next item (eg. reading the next file) overlaps with whatever the consumer does with this one.
+    An exception raised by the producer is re-raised in the consumer.
+    """
+    q = queue.Queue(maxsize=maxsize)
+    stop = threading.Event() # set when the consumer quits early so the producer doesn't block on a full queue
+
+    def _producer():
+        try:
+            for pair in pairs:
+                if stop.is_set():
+                    return
+                q.put(pair)
+        except BaseException as e:
+            q.put((_DONE, e))
+            return
+        q.put((_DONE, None))
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        producer = pool.submit(_producer)
+        try:
+            while True:
+                item = q.get()
+                if item[0] is _DONE:
+                    if item[1] is not None:
+                        raise item[1]
+                    return
+                yield item
+        finally:
+            stop.set()
+            while not producer.done(): # unblock a pending put so the thread can see 'stop'
+                try:
+                    q.get(timeout=0.05)
+                except queue.Empty:
+                    pass
+
+
+def push_stream(pairs, path: str, process_type: str, reporting=False, maxsize: int = 4, writers: int = 1):
+    """
+    Pushes (name, DataFrame) pairs (or a {name: DataFrame} dict) on writer threads while 'pairs' is still being produced, so writing one file overlaps with processing the next.
+    With writers > 1 several files are written at once; a given name always goes to the same writer so repeated names are still written in order.
+    The bounded queues cap how many processed frames are held in memory at once.
+    """
+    pusher = get_pFuncs(process_type, "push")
+    writers = max(1, writers)
+    qs = [queue.Queue(maxsize=maxsize) for _ in range(writers)]
+    if reporting: # once per stream, not per file
+        print(f"[INFO] Pushing files for process_type={process_type} to {path}")
+
+    def _writer(q):
+        while (item := q.get()) is not _DONE:
+            fname, df = item
+            try:
+                pusher(df, fname, path)
+            except Exception as e:
+                print(f"[ERROR] Failed to push '{fname}' for {process_type}: {e}")
+
+    with ThreadPoolExecutor(max_workers=writers) as pool:
+        futures = [pool.submit(_writer, q) for q in qs]
+        try:
+            for pair in (pairs.items() if isinstance(pairs, dict) else pairs):
+                qs[hash(str(pair[0])) % writers if writers > 1 else 0].put(pair)
+        finally:
+            for q in qs:
+                q.put(_DONE)
+        for future in futures:
+            future.result()
 
 
 # --------
 # run function that wraps everything together
 # --------
-def run(pull_path: str, push_path: str, process_type: str, reporting=False):
+def run(pull_path: str, push_path: str, process_type: str, reporting=False, max_workers: int = 1, maxsize: int = 4):
+    """
+    pull → process → push as three overlapping stages: files are read on a reader thread, processed here,
+    and written on a writer thread, with at most 'maxsize' files waiting between each pair of stages.
+    """
     print(f"Running pipeline, process type: {process_type}")
-    raw_dict = pull(path=pull_path, process_type=process_type, reporting=reporting)
-    clean_dict = process(files=raw_dict, process_type=process_type, reporting=reporting)
-    push(dfs=clean_dict, path=push_path, process_type=process_type, reporting=reporting)
+    raw_pairs = _background(pull_iter(path=pull_path, process_type=process_type, reporting=reporting), maxsize=maxsize)
+    clean_pairs = process_iter(files=raw_pairs, process_type=process_type, reporting=reporting, max_workers=max_workers)
+    push_stream(clean_pairs, path=push_path, process_type=process_type, reporting=reporting, maxsize=maxsize, writers=max_workers)
@@ -1,100 +1,263 @@
+import csv
+import io
+import os
 import pandas as pd
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
+try:
+    from pyarrow import ArrowInvalid as _ARROW_INVALID
+except ImportError: # pyarrow is optional, reads fall back to the C parser
+    _ARROW_INVALID = None
 
-def pull_csv(path, process_type):
+_READ_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+
+def _list_files(p):
+    """
+    Lists the visible files in directory `p` as os.DirEntry objects in one os.scandir pass.
+    DirEntry caches its type (and stat, once asked) so callers filter and sort without extra syscalls per entry.
+    """
+    with os.scandir(p) as it:
+        return [e for e in it if not e.name.startswith(".") and e.is_file()]
+
+def _by_suffix(entries, suffix):
+    """
+    Sorted (stem, path) pairs for the entries whose name ends in `suffix`.
+    """
+    return sorted((e.name[:-len(suffix)], e.path) for e in entries if e.name.endswith(suffix))
+
+def _scan_dir(p, suffix):
+    """
+    Lists (stem, path) for the files in directory `p` ending in `suffix`, sorted by name.
+    """
+    return _by_suffix(_list_files(p), suffix)
+
+def _readahead(paths):
+    """
+    Asks the kernel to start reading every file in `paths` in the background (POSIX_FADV_WILLNEED), so the
+    whole batch is queued with the disk at once and the per-file reads that follow are served from the page cache.
+    No-op where posix_fadvise isn't available; failures are left for the real read to report.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+def _read_pooled(entries, reader, max_workers=_READ_WORKERS):
+    """
+    Applies `reader` to each (stem, path) in `entries` on a thread pool and yields (stem, result) in the same order.
+    At most max_workers files are read ahead of the consumer so streaming callers keep a bounded footprint.
+    """
+    if len(entries) <= 1:
+        for stem, path in entries:
+            yield stem, reader(path)
+        return
+
+    # an entry's path may be a tuple of files read together (eg. FR csv + txt)
+    _readahead(f for _, path in entries for f in (path if isinstance(path, tuple) else (path,)) if f)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(entries))) as pool:
+        pending = deque()
+        for stem, path in entries:
+            pending.append((stem, pool.submit(reader, path)))
+            if len(pending) >= max_workers:
+                stem, future = pending.popleft()
+                yield stem, future.result()
+        while pending:
+            stem, future = pending.popleft()
+            yield stem, future.result()
+
+def _config_dtypes(process_type):
+    """
+    Looks up the 'dtypes' map configured for `process_type` in PROCESS_TYPES, None if there isn't one.
+    """
+    from ASFINT.Config.Config import get_pFuncs # local import, Config imports this module
+    try:
+        return get_pFuncs(process_type, 'dtypes')
+    except ValueError:
+        return None
+
+def _arrow_names(columns):
+    """
+    Renames the columns the way the C parser would: blank headers become 'Unnamed: i' and repeats get a '.n' suffix.
+    """
+    names = [f"Unnamed: {i}" if isinstance(col, str) and col == "" else col for i, col in enumerate(columns)]
+    header, counts = set(names), {}
+    for i, col in enumerate(names):
+        base, count = col, counts.get(col, 0)
+        while count > 0:
+            counts[base] = count + 1
+            col = f"{base}.{count}"
+            count = count + 1 if col in header else counts.get(col, 0)
+        names[i] = col
+        counts[col] = count + 1
+    return names
+
+def _read_csv(f, dtypes=None, chunksize=None, **kwargs):
+    """
+    Reads a csv with the multi-threaded pyarrow parser when pyarrow is installed, falling back to the C parser
+    if it isn't or if pyarrow rejects the file (e.g. ragged rows).
+    With `chunksize`, the C parser reads `chunksize` rows at a time so its buffers stay bounded on very large files;
+    pass explicit `dtypes` with it, otherwise each chunk infers its own column types.
+    """
+    if chunksize:
+        with pd.read_csv(f, dtype=dtypes, chunksize=chunksize, low_memory=True, **kwargs) as reader:
+            return pd.concat(reader, ignore_index=True)
+    if _ARROW_INVALID is not None:
+        try:
+            df = pd.read_csv(f, dtype=dtypes, engine="pyarrow", **kwargs)
+        except (_ARROW_INVALID, pd.errors.ParserError):
+            pass
+        else:
+            if kwargs.get("header", "infer") is not None:
+                df.columns = _arrow_names(df.columns)
+            return df
+    # low_memory=False infers each column's type from the whole file in one pass instead of chunk by chunk
+    return pd.read_csv(f, dtype=dtypes, low_memory=False, **kwargs)
+
+def _iter_csv(p, dtypes=None, chunksize=None):
+    if p.is_dir():
+        yield from _read_pooled(_scan_dir(p, ".csv"), partial(_read_csv, dtypes=dtypes, chunksize=chunksize))
+    else:
+        yield p.stem, _read_csv(p, dtypes, chunksize)
+
+def pull_csv(path, process_type, stream=False, chunksize=None):
     """
     Load .csv inputs.
     - If `path` is a directory: read all *.csv files into {stem: DataFrame}.
     - If `path` is a file: read that file only.
+    - If `stream` is True: return a generator of (stem, DataFrame) pairs instead, reading one file at a time.
+    - If `chunksize` is set: parse each file `chunksize` rows at a time to cap the parser's peak memory.
     FR note: if FR expects (df, text), adapt here (e.g., pair with a .txt of same stem).
     """
-    p = Path(path)
+    p = path if isinstance(path, Path) else Path(path)
 
     if not p.exists():
         raise FileNotFoundError(f"Input path does not exist: {p}")
+    if not p.is_dir() and p.suffix.lower() != ".csv":
+        raise ValueError(f"Expected a .csv file, got: {p.name}")
 
-    out = {}
+    pairs = _iter_csv(p, _config_dtypes(process_type), chunksize)
+    return pairs if stream else dict(pairs)
+
+def _read_txt(f):
+    """
+    Reads a text file as utf-8 (undecodable bytes dropped) with one fstat and as few os.read calls as the kernel allows.
+    Newlines are normalized to '\n' the same way open() in text mode would.
+    """
+    fd = os.open(f, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        buf = os.read(fd, size + 1) # +1 so a file that grew since fstat is still read to EOF below
+        if len(buf) > size:
+            chunks = [buf]
+            while chunk := os.read(fd, 1 << 16):
+                chunks.append(chunk)
+            buf = b"".join(chunks)
+    finally:
+        os.close(fd)
+    text = buf.decode("utf-8", "ignore")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+def _iter_txt(p):
     if p.is_dir():
-        for f in sorted(p.glob("*.csv")):
-            df = pd.read_csv(f)
-            out[f.stem] = df
+        yield from _read_pooled(_scan_dir(p, ".txt"), _read_txt)
     else:
-        if p.suffix.lower() != ".csv":
-            raise ValueError(f"Expected a .csv file, got: {p.name}")
-        df = pd.read_csv(p)
-        out[p.stem] = df
-
-    return out
+        yield p.stem, _read_txt(p)
 
-def pull_txt(path, process_type):
+def pull_txt(path, process_type, stream=False):
     """
     Load .txt inputs.
     - If `path` is a directory: read all *.txt files into {stem: text}.
     - If `path` is a file: read that file only.
+    - If `stream` is True: return a generator of (stem, text) pairs instead, reading one file at a time.
     """
-    p = Path(path)
+    p = path if isinstance(path, Path) else Path(path)
 
     if not p.exists():
         raise FileNotFoundError(f"Input path does not exist: {p}")
+    if not p.is_dir() and p.suffix.lower() != ".txt":
+        raise ValueError(f"Expected a .txt file, got: {p.name}")
+
+    pairs = _iter_txt(p)
+    return pairs if stream else dict(pairs)
 
-    out = {}
+def _read_fr(csv_file, txt_file=None, dtypes=None, chunksize=None):
+    # Read FR CSV with no header (date is in row 2, table headers come later)
+    df = _read_csv(csv_file, dtypes, chunksize, header=None)
+    # Matching TXT file, empty string if there isn't one
+    text = _read_txt(txt_file) if txt_file else ""
+    return df, text
+
+def _iter_fr(p, dtypes=None, chunksize=None):
     if p.is_dir():
-        for f in sorted(p.glob("*.txt")):
-            text = f.read_text(encoding="utf-8", errors="ignore")
-            out[f.stem] = text
+        # One pass over the listing splits it into {stem: path} for CSVs and for .txt partners,
+        # so each CSV's partner is a dict lookup rather than an exists() stat per file
+        csvs, txts = {}, {}
+        for e in _list_files(p):
+            if e.name.endswith(".csv"):
+                csvs[e.name[:-4]] = e.path
+            elif e.name.endswith(".txt"):
+                txts[e.name[:-4]] = e.path
+        # csv and matching txt are read back to back by the same worker
+        yield from _read_pooled(
+            [(stem, (csvs[stem], txts.get(stem))) for stem in sorted(csvs)],
+            lambda pair: _read_fr(pair[0], pair[1], dtypes, chunksize)
+        )
     else:
-        if p.suffix.lower() != ".txt":
-            raise ValueError(f"Expected a .txt file, got: {p.name}")
-        text = p.read_text(encoding="utf-8", errors="ignore")
-        out[p.stem] = text
-
-    return out
+        txt_file = p.with_suffix(".txt")
+        yield p.stem, _read_fr(p, txt_file if txt_file.exists() else None, dtypes, chunksize)
 
-def pull_fr(path, process_type):
+def pull_fr(path, process_type, stream=False, chunksize=None):
     """
     Load FR inputs as (DataFrame, text) tuples.
     - Pairs .csv files with matching .txt files by stem name
     - If no matching .txt exists, uses empty string as text
-    - Returns {stem: (DataFrame, text)}
+    - Returns {stem: (DataFrame, text)}, or a generator of (stem, (DataFrame, text)) pairs if `stream` is True
+    - If `chunksize` is set: parse each CSV `chunksize` rows at a time (the .txt sidecars are small and read whole)
 
     IMPORTANT: FR CSVs are read with header=None because:
     - Row 1 is blank/separators
     - Row 2 contains the date (YYYY-MM-DD Finance Committee...)
     - The actual data table headers start later
     """
-    p = Path(path)
+    p = path if isinstance(path, Path) else Path(path)
 
     if not p.exists():
         raise FileNotFoundError(f"Input path does not exist: {p}")
+    if not p.is_dir() and p.suffix.lower() != ".csv":
+        raise ValueError(f"Expected a .csv file, got: {p.name}")
 
-    out = {}
-    if p.is_dir():
-        # Find all CSV files
-        for csv_file in sorted(p.glob("*.csv")):
-            # Read FR CSV with no header (date is in row 2, table headers come later)
-            df = pd.read_csv(csv_file, header=None)
-            # Look for matching TXT file
-            txt_file = csv_file.with_suffix(".txt")
-            if txt_file.exists():
-                text = txt_file.read_text(encoding="utf-8", errors="ignore")
-            else:
-                text = ""  # Empty string if no matching txt
-            out[csv_file.stem] = (df, text)
-    else:
-        if p.suffix.lower() != ".csv":
-            raise ValueError(f"Expected a .csv file, got: {p.name}")
-        # Read FR CSV with no header (date is in row 2, table headers come later)
-        df = pd.read_csv(p, header=None)
-        # Look for matching TXT file
-        txt_file = p.with_suffix(".txt")
-        if txt_file.exists():
-            text = txt_file.read_text(encoding="utf-8", errors="ignore")
-        else:
-            text = ""  # Empty string if no matching txt
-        out[p.stem] = (df, text)
+    pairs = _iter_fr(p, _config_dtypes(process_type), chunksize)
+    return pairs if stream else dict(pairs)
 
-    return out
+def _first_row_has(fh, column):
+    """
+    Whether `column` is a cell of the first non-blank row of the binary csv handle `fh`, ie. whether pd.read_csv's
+    default header holds it. Only that first row is read; the handle is rewound to the start afterwards.
+    """
+    text = io.TextIOWrapper(fh, encoding="utf-8-sig", errors="ignore", newline="")
+    try:
+        for row in csv.reader(text):
+            if len(row) > 1 or (row and row[0].strip()): # pandas skips empty and whitespace-only lines when picking the header
+                return column in row
+        return False
+    finally:
+        text.detach() # hand fh back open
+        fh.seek(0)
 
 def pull_reconcile(path, process_type):
     """
@@ -103,7 +266,7 @@ def pull_reconcile(path, process_type):
     - Returns {'fr': fr_df, 'agenda': agenda_df}
     - Raises error if either file type is not found
     """
-    p = Path(path)
+    p = path if isinstance(path, Path) else Path(path)
 
     if not p.exists():
         raise FileNotFoundError(f"Input path does not exist: {p}")
@@ -111,19 +274,29 @@ def pull_reconcile(path, process_type):
     if not p.is_dir():
         raise ValueError(f"Reconcile process requires a directory path, got file: {p}")
 
-    # Find FR file (contains "Cleaned" in filename)
-    fr_files = list(p.glob("*Cleaned*.csv"))
-    if not fr_files:
-        raise FileNotFoundError(f"No FR file found in {p}. Expected file with 'Cleaned' in name.")
+    # One listing for both, keeping a running newest (mtime, entry) per kind: FR files contain "Cleaned" in the name,
+    # Agenda files contain "Agenda". A file matching both counts for both, as with the old pair of globs.
+    newest_fr = newest_agenda = None
+    for e in _list_files(p):
+        if not e.name.endswith(".csv"):
+            continue
+        is_fr, is_agenda = "Cleaned" in e.name, "Agenda" in e.name
+        if not (is_fr or is_agenda):
+            continue
+        mtime = e.stat().st_mtime
+        if is_fr and (newest_fr is None or mtime >= newest_fr[0]):
+            newest_fr = (mtime, e)
+        if is_agenda and (newest_agenda is None or mtime >= newest_agenda[0]):
+            newest_agenda = (mtime, e)
 
-    # Find Agenda file (contains "Agenda" in filename)
-    agenda_files = list(p.glob("*Agenda*.csv"))
-    if not agenda_files:
+    if newest_fr is None:
+        raise FileNotFoundError(f"No FR file found in {p}. Expected file with 'Cleaned' in name.")
+    if newest_agenda is None:
         raise FileNotFoundError(f"No Agenda file found in {p}. Expected file with 'Agenda' in name.")
 
     # Use the most recent file if multiple matches
-    fr_file = sorted(fr_files, key=lambda x: x.stat().st_mtime)[-1]
-    agenda_file = sorted(agenda_files, key=lambda x: x.stat().st_mtime)[-1]
+    # the DirEntry already has the name and path, no Path object needed
+    fr_file, agenda_file = newest_fr[1], newest_agenda[1]
 
     print(f"[RECONCILE PULL] Using FR file: {fr_file.name}")
     print(f"[RECONCILE PULL] Using Agenda file: {agenda_file.name}")
@@ -131,14 +304,17 @@ def pull_reconcile(path, process_type):
     # Load the dataframes
     # Try reading with default header first (for new format)
     # If 'Org Name' column is missing, try header=1 (for old format with blank header row)
-    fr_df = pd.read_csv(fr_file)
-    if 'Org Name' not in fr_df.columns:
-        print(f"[RECONCILE PULL] Warning: 'Org Name' not found in header, trying header=1")
-        fr_df = pd.read_csv(fr_file, header=1)
-    agenda_df = pd.read_csv(agenda_file)
+    # The header row is sniffed from the first line so the file is only parsed once, through the same open handle
+    with open(fr_file.path, "rb") as fh:
+        if _first_row_has(fh, 'Org Name'):
+            fr_df = pd.read_csv(fh)
+        else:
+            print(f"[RECONCILE PULL] Warning: 'Org Name' not found in header, trying header=1")
+            fr_df = pd.read_csv(fh, header=1)
+    agenda_df = pd.read_csv(agenda_file.path)
 
     # Extract FR filename stem (without extension) for use in output naming
-    fr_filename = fr_file.stem
+    fr_filename = fr_file.name[:-len(".csv")]
 
     # Return as tuple (fr_df, agenda_df, fr_filename) to pass filename info
     return {'reconcile': (fr_df, agenda_df, fr_filename)}
\ No newline at end of file
@@ -1,19 +1,68 @@
 import re
 from pathlib import Path
 
+try:
+    import pyarrow as _pa
+    import pyarrow.csv as _pcsv
+except ImportError: # pyarrow is optional, push_csv falls back to DataFrame.to_csv
+    _pa = None
+
+_ARROW_MIN_ROWS = 1000 # below this Arrow's setup cost outweighs its faster writer
+
 _SAFE_CHARS = re.compile(r'[\\/:"*?<>|]+')  # Windows + Unix unsafe
+_UNSAFE = frozenset('\\/:"*?<>|')
 
 def _safe_filename(name: str) -> str:
-    return _SAFE_CHARS.sub("-", str(name)).strip()
+    name = str(name)
+    if _UNSAFE.isdisjoint(name): # the usual case: one C-level scan, no regex
+        return name.strip()
+    return _SAFE_CHARS.sub("-", name).strip() # a run of unsafe characters collapses into a single '-'
+
+def _arrow_table(df):
+    """
+    Converts `df` to an Arrow table when Arrow would write its rows the same way to_csv does, else returns None.
+    Only text, integer and all-null columns qualify: Arrow formats floats ('1' vs '1.0'), bools and timestamps differently.
+    Single-column frames are left to to_csv, which writes an empty value as '""' when it is the whole row.
+    """
+    if len(df.columns) < 2 or not df.columns.is_unique:
+        return None
+    try:
+        table = _pa.Table.from_pandas(df, preserve_index=False)
+    except (_pa.ArrowInvalid, _pa.ArrowTypeError, _pa.ArrowNotImplementedError):
+        return None # eg. object columns mixing strings and numbers
+    types = _pa.types
+    if all(types.is_string(t) or types.is_large_string(t) or types.is_integer(t) or types.is_null(t) for t in table.schema.types):
+        return table
+    return None
+
+def _write_arrow(table, df, out):
+    """
+    Writes the header with pandas and the rows with Arrow's C++ writer, unquoted so the bytes match to_csv's.
+    Returns False if a value needs quoting (a comma, quote or line break), which Arrow refuses to write unquoted.
+    """
+    with open(out, "wb") as fh:
+        fh.write(df.iloc[:0].to_csv(index=False, lineterminator="\n").encode("utf-8"))
+        try:
+            _pcsv.write_csv(table, fh, _pcsv.WriteOptions(include_header=False, quoting_style="none"))
+        except _pa.ArrowInvalid:
+            return False
+    return True
 
 def push_csv(df, filename, filepath):
     """Write a CSV to disk; filename can be logical (we’ll sanitize)."""
     # ensure folder exists
-    path = Path(filepath)
+    path = filepath if isinstance(filepath, Path) else Path(filepath)
     path.mkdir(parents=True, exist_ok=True)
 
     # sanitize filename (no extensions in name expected here)
     safe = _safe_filename(filename)
     out = path / f"{safe}.csv"
 
-    df.to_csv(out, index=False)
\ No newline at end of file
+    # large plain text/int frames go through Arrow's multi-threaded C++ writer, byte for byte the same file as to_csv
+    if _pa is not None and len(df) >= _ARROW_MIN_ROWS:
+        table = _arrow_table(df)
+        if table is not None and _write_arrow(table, df, out):
+            return
+
+    # fixed '\n' line endings so output is identical on every OS; chunksize bounds the rows formatted per write
+    df.to_csv(out, index=False, chunksize=64_000, lineterminator="\n")
\ No newline at end of file
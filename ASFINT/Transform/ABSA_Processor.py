@@ -3,21 +3,22 @@ import pandas as pd
 
 # full path should be the way as long as: 
 
-from ASFINT.Utility.Utils import heading_finder
+from ASFINT.Utility.Utils import heading_finder_many
 from ASFINT.Utility.Cleaning import is_type
 
 def _dropper(instance, dictionary):
     """
-    Function Removes an occurence of 'instance' from either 'Header' or 'No Header'.
+    Function Removes 'instance' from either 'Header' or 'No Header'.
+    Both are expected as dicts keyed by label (insertion-ordered sets), so membership and removal are O(1).
     """
-    if instance in set(dictionary['Header']): #convert to set for amortized O(1) membership checking, yay hashsets
-        dictionary['Header'].remove(instance)
-    elif instance in set(dictionary['No Header']):
-        dictionary['No Header'].remove(instance)
+    if instance in dictionary['Header']:
+        del dictionary['Header'][instance]
+    elif instance in dictionary['No Header']:
+        del dictionary['No Header'][instance]
     else: 
         raise ValueError(f"""Drop input {instance} not in any of the subframes set to be selected. Subframes to be selected include:
-                            'Header' subframes: {dictionary['Header']}
-                            'No Header' subframes: {dictionary['No Header']}
+                            'Header' subframes: {list(dictionary['Header'])}
+                            'No Header' subframes: {list(dictionary['No Header'])}
                         """)
 
 def ABSA_Processor(df: pd.DataFrame, Cats: dict[str, list[str]] = None, Drop: str = None, Add: str = None) -> pd.DataFrame:
@@ -51,35 +52,37 @@ def ABSA_Processor(df: pd.DataFrame, Cats: dict[str, list[str]] = None, Drop: st
 
     if Drop is not None:
         assert is_type(Drop, str), 'Drop must be a string or iterable of strings specifying column type'
+        # build the label sets once (dicts keep the section order) instead of per membership check
+        Types['Header'] = dict.fromkeys(Types['Header'])
+        Types['No Header'] = dict.fromkeys(Types['No Header'])
         if isinstance(Drop, str):
             _dropper(Drop, Types)
         else:
-            for cat in Drop: #convert to set for amortized O(1) membership checking, yay hashsets
+            for cat in Drop:
                 _dropper(cat, Types)
 
     # if Add is not none: 
         ### TO DO ###
 
 
+    # every section comes out of one scan of the first column instead of one heading_finder call per label
+    header_labels, no_header_labels = list(Types['Header']), list(Types['No Header'])
+    sections = heading_finder_many(df, [(label, 1) for label in header_labels] + [(label, 0) for label in no_header_labels],
+                                   start_col = 0, end = 'SUBTOTAL', drop_null_cols = True)
+
     sub_frames = []
-    for label in Types['Header']:
-        header_result: pd.DataFrame = heading_finder(df = df, start_col = 0, start = label, shift = 1, end = 'SUBTOTAL', start_logic = 'exact', end_logic = 'contains')
+    for label, header_result in zip(header_labels, sections[:len(header_labels)]):
         if header_result.empty: 
             print(f"Warning: No data found for label {label} under the 'Header' category.")
         else: 
-            header_result['Org Category'] = np.full(len(header_result), label)
-            header_result = header_result.loc[:, ~header_result.columns.isna()] # drop any null columns
-            header_result = header_result.reset_index(drop=True)
+            header_result['Org Category'] = label
             sub_frames.append(header_result)
-    for label in Types['No Header']:
-        no_header_result: pd.DataFrame = heading_finder(df = df, start_col = 0, start = label, shift = 0, end = 'SUBTOTAL', start_logic = 'exact', end_logic = 'contains') 
+    for label, no_header_result in zip(no_header_labels, sections[len(header_labels):]):
         if no_header_result.empty: 
             print(f"Warning: No data found for label {label} under the 'No Header' category.")
         else:
-            no_header_result['Org Category'] = np.full(len(no_header_result), label)
-            no_header_result = no_header_result.loc[:, ~no_header_result.columns.isna()] # drop any null columns
-            no_header_result = no_header_result.reset_index(drop=True)
             no_header_result.columns = no_header_result.columns.str.strip()
+            no_header_result['Org Category'] = label
             if label in no_header_result.columns:
                 no_header_result = no_header_result.rename(columns={label: 'Organization'})
             else:
@@ -92,4 +95,7 @@ def ABSA_Processor(df: pd.DataFrame, Cats: dict[str, list[str]] = None, Drop: st
     #         raise ValueError(f'No exact matches found in first column for label {label}')
         ### TO DO ###
 
-    return pd.concat(sub_frames, ignore_index=True)
+    result = pd.concat(sub_frames, ignore_index=True, copy=False) # sections are already private copies, no need for a defensive one
+    # a dozen distinct labels repeated over every row: store them as small int codes
+    result['Org Category'] = result['Org Category'].astype('category')
+    return result
@@ -1,12 +1,112 @@
 import numpy as np
 import pandas as pd
+import functools
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+try:
+    import re2 as _re2 # google-re2: DFA matching, linear in input length with no catastrophic backtracking
+except ImportError:
+    _re2 = None
+
 from ASFINT.Utility.Cleaning import in_df, is_type
 from ASFINT.Utility.Utils import column_converter
 
+# Opt-in (ASFINT_RE2=1) since RE2's \s, \d and \w are ASCII-only: text using eg. non-breaking spaces after list
+# numbers would parse differently than with re. Only patterns without lookarounds (which RE2 lacks) use this engine.
+_USE_RE2 = _re2 is not None and os.environ.get("ASFINT_RE2") == "1"
+_fast_re = _re2 if _USE_RE2 else re
+
+# Static patterns are compiled once at import rather than looked up in re's cache on every call
+_LIST_MARKER_RE = re.compile(r'(?<=\d)\.(?=\s)') # the period of "1." list markers, not decimals like "$43.72"; lookarounds keep the digit and whitespace out of the match
+_INPT_CLEAN_PATTERN = r"\(\$?\d+,?\d*\.?\d*\)" # parenthesized amounts like "($1,200.50)"
+_INPT_CLEAN_RE = _fast_re.compile(_INPT_CLEAN_PATTERN)
+# list-marker periods and parenthesized amounts removed in one pass over a modern-format agenda; neither pattern can
+# create or break a match of the other, so this is the same as _LIST_MARKER_RE.sub followed by _INPT_CLEAN_RE.sub
+_PREPROCESS_RE = re.compile(rf"{_INPT_CLEAN_PATTERN}|{_LIST_MARKER_RE.pattern}")
+_DATE_IDENTIFIER = r'(?:\w+,\s)?(\w+\s\d{1,2}\w*,\s\d{4})' # default Agenda_Processor identifier, eg. "Monday, March 3, 2025"
+_DATE_IDENTIFIER_RE = re.compile(_DATE_IDENTIFIER)
+_PENDING_BUSINESS_RE = re.compile(r'Pending Business', re.IGNORECASE)
+_NESTED_SECTIONS_RE = re.compile(r'Pending Business.*?(Contingency Funding|Senate Contingency Funding|Finance Rule Waiver)', re.DOTALL | re.IGNORECASE)
+
+# modern format
+_VALID_NAME_CHARS = r'\w\s\-\_\*\&\%\$\+\#\@\!\(\)\,\'\"\[\]\.:' #seems to perform better with explicit handling for special characters? eg. for 'Telegraph+' we add the plus sign so regex will pick it up. Added \[\] for brackets and \. for periods in names like "Inc."
+_CLUB_NAME_RE = re.compile(rf'[{_VALID_NAME_CHARS}]+') #a numbered line is a club name if it is made only of these characters (and isn't a Motion/Seconded line)
+_LINE_RE = _fast_re.compile(r'\d+\s(.+)\n?') #matches every single line that comes in the format "<digit><space><anything>"
+# asterisks anywhere plus the trailing whitespace/comma/whitespace tail, i.e. the old replace('*') -> ',\s*$' -> rstrip sequence in one pass
+_NAME_CLEAN_RE = re.compile(r'[\s*]*(?:,[\s*]*)?$|\*')
+# every motion outcome in one alternation; the named group that matched (m.lastgroup) says which kind it is
+_DECISION_RE = _fast_re.compile( # keep _decide's 'pprove'/'tabl'/'deny' prefilter in sync with these alternatives
+   r'(?P<denied>tabled?\sindefin(?:etly|itely)|deny)'
+   r'|(?P<tabled>tabled?\s(?:until|for|to))'
+   r'|(?P<partial>[pP]artially\s+[aA]pprove\s+(?:for\s+)?\$?(?P<partial_amt>\d+(?:,\d+)?(?:\.\d+)?))'
+   r'|(?P<approve>[aA]pprove\s+(?:for\s+)?\$?(?P<approve_amt>\d+(?:,\d+)?(?:\.\d+)?))'
+   r'|(?P<approve_bare>[aA]pprove)'
+)
+
+# 2020/2021 nested format
+_NESTED_SECTION_MAP = {
+   'Sponsorship': 'Sponsorship',
+   'Senate Contingency Funding': 'Contingency',
+   'Contingency Funding': 'Contingency',  # Spring 2021 uses this
+   'Contingency': 'Contingency',
+   'Funding': 'Contingency',  # Spring 2020 uses just "Funding"
+   'Space Reservation': 'Space Reservation',
+   'Finance Rule Waiver': 'Finance Rule',  # Spring 2021 uses full name
+   'Finance Rule': 'Finance Rule',
+   'Rule Waiver': 'Rule Waiver',
+   'ABSA Appeals': 'ABSA Appeals'
+}
+# Pattern to match section and its content until next section at same indentation level
+# Sections are numbered like "1. Sponsorship", "2. Senate Contingency Funding"
+# We want to capture everything until the next section at the same level (minimal indent + number)
+# More specific: capture until we hit another section name from our map
+_NESTED_SECTION_RES = {
+   section_name: re.compile(
+      rf'(\d+)\s+{re.escape(section_name)}\s*\n(.*?)(?=\n\s{{0,8}}\d+\s+(?:{"|".join(re.escape(s) for s in _NESTED_SECTION_MAP if s != section_name)})|$)',
+      re.DOTALL | re.IGNORECASE)
+   for section_name in _NESTED_SECTION_MAP
+}
+# any "<number> <section name>" header line, so sections without one are skipped before running their own pattern
+_NESTED_HEADER_RE = re.compile(rf'\d+\s+({"|".join(re.escape(s) for s in _NESTED_SECTION_MAP)})\s*\n', re.IGNORECASE)
+# Pending Business runs from its header to the next Adjournment/Guest item, the FR subsection from its header line to the next top-level item;
+# the region is sliced out between a header search and an end search instead of with one lazy DOTALL match
+_PENDING_END_RE = re.compile(r'\d+\s+(?:Adjournment|Guest)', re.IGNORECASE)
+_FR_HEADER_RE = re.compile(r'\d+\s+FR \d+/\d+ S\d+\s*\n', re.IGNORECASE)
+_FR_END_RE = re.compile(r'\n\s{0,3}\d+\s+[A-Z]', re.IGNORECASE)
+_ORG_LINE_RE = re.compile(r'(\d+)\s+(.+)') # matched against an org line with its 6-10 character indent already stripped
+# the nested decision patterns have no lookarounds, so they can run on RE2; case-insensitivity is inline (?i) since re2.compile takes no flags
+_NOT_ORG_RE = _fast_re.compile(r'(?i)(Motion|Second|Senator.*motions?\s+to\s+(pass|send)\s+FR)')
+_NESTED_DENIED_RE = _fast_re.compile(r'(?i)(tabled?\sindefinetly)|(tabled?\sindefinitely)|(table\sindefinitely)|(deny)|not present.*tabled')
+_NESTED_TABLED_RE = _fast_re.compile(r'(?i)(tabled?\suntil)|(tabled?\sfor)|(tabled?\sto)|(table\sto)|(tabled to next week)|not present.*tabled')
+_NESTED_MOTION_RE = _fast_re.compile(r'(?i)(motion\s+(passes|passed|approved))|(motions?\s+to\s+(sponsor|approve|amend))')
+_NESTED_PASSED_RE = _fast_re.compile(r'(?i)motion\s+(passed|approved)')
+# "waiver for $X", "allocate $X" and "approve $X" amounts in one alternation; the named group says which kind matched
+_NESTED_AMT_RE = _fast_re.compile(
+   r'(?i)waiver\s+for\s+\$?(?P<waiver>\d+(?:,\d+)?(?:\.\d+)?)'
+   r'|allocate\s+\$?(?P<allocate>\d+(?:,\d+)?(?:\.\d+)?)'
+   r'|approve\s+(?:for\s+)?\$?(?P<approve>\d+(?:,\d+)?(?:\.\d+)?)')
+
+def _slice_until(text, start, end_re):
+   """
+   text[start:] up to the first end_re match, or to the end of text (less one trailing newline) if there is none,
+   the same region a lazy '.*?(?=<end>|$)' capture would give.
+   """
+   end_match = end_re.search(text, start)
+   if end_match:
+      return text[start:end_match.start()]
+   return text[start:-1] if text.endswith('\n') else text[start:]
+
 def _find_chunk_pattern(starts, ends, end_prepattern = r'\d+\s'):
+      r"""
+      Builds the regex pattern string for a chunk; lists are accepted and converted to tuples for the memoized builder.
+      """
+      return _chunk_pattern(tuple(starts), tuple(ends), end_prepattern)
+
+@functools.lru_cache(maxsize=256)
+def _chunk_pattern(starts, ends, end_prepattern = r'\d+\s'):
       r"""
       Extracts a chunk of text from 'inpt' text based on start and end keywords.
       starts (list[str]): List of keywords to start the chunk of text we want to extract
@@ -24,26 +124,54 @@ def _find_chunk_pattern(starts, ends, end_prepattern = r'\d+\s'):
 
       assert isinstance(end_prepattern, str), f'end_prepattern should be a string but is type {type(end_prepattern)}'
       
-      pattern = ''
-      if len(starts) == 1:
-          pattern += starts[0]
-      else: 
-         pattern = '(?:'
-         for start_keyword in starts[:-1]: 
-            pattern += start_keyword + '|'
-         pattern += starts[-1] + ')'
-      
-      pattern += r'\s*?([\s\S]*?)(?:' # make sure to have the '*?' to do non-greedy matching
-
-      if len(ends) == 1:
-         pattern += ends[0]
-      else: 
-         for end_keyword in ends[:-1]: 
-            pattern += end_prepattern + end_keyword + '|'
-         pattern += end_prepattern + ends[-1]
-
-      pattern += ')'
-      return pattern
+      # keywords are matched literally, the same way _present_sections detects them
+      starts = [re.escape(start) for start in starts]
+      ends = [re.escape(end_keyword) for end_keyword in ends]
+      starts_group = starts[0] if len(starts) == 1 else f"(?:{'|'.join(starts)})"
+      # a lone end keyword is used as is, without end_prepattern
+      ends_group = ends[0] if len(ends) == 1 else '|'.join(end_prepattern + end_keyword for end_keyword in ends)
+      return rf'{starts_group}\s*?([\s\S]*?)(?:{ends_group})' # make sure to have the '*?' to do non-greedy matching
+
+@functools.lru_cache(maxsize=256)
+def _compiled_chunk_pattern(starts, ends, end_prepattern = r'\d+\s'):
+   """Compiled _chunk_pattern, so each (starts, ends) combination is compiled once per process rather than once per agenda."""
+   return _fast_re.compile(_chunk_pattern(starts, ends, end_prepattern))
+
+@functools.lru_cache(maxsize=16)
+def _identifier_re(identifier):
+   """Compiled custom date identifier; the default one is _DATE_IDENTIFIER_RE."""
+   return re.compile(identifier)
+
+@functools.lru_cache(maxsize=64)
+def _section_marker_re(section):
+   """Compiled "<number> <section>" pattern used to check whether a section appears in an agenda; section is matched literally."""
+   return _fast_re.compile(rf"\d+\s{re.escape(section)}")
+
+@functools.lru_cache(maxsize=64)
+def _sections_marker_re(sections):
+   """Compiled "<number> " followed by any of sections; the lookahead leaves the keyword itself unconsumed."""
+   return re.compile(r"\d+\s(?=" + "|".join(re.escape(section) for section in sections) + ")")
+
+def _present_sections(inpt, sections):
+   """
+   Returns {section: start of its first "<number> <section>" marker} for the sections that appear in inpt, from one scan
+   for all of them instead of one full-document search per section.
+   Every hit is checked against each still-missing section, so a section matching at the same spot as an earlier one
+   (eg. 'Contingency' and 'Contingency Funding') is still reported.
+   Sections that don't occur in inpt as plain substrings are dropped with a str 'in' check before any regex runs.
+   """
+   present = {}
+   missing = [section for section in sections if section in inpt]
+   if not missing:
+      return present
+   for m in _sections_marker_re(tuple(missing)).finditer(inpt):
+      start = m.start()
+      for section in [section for section in missing if _section_marker_re(section).match(inpt, start)]:
+         present[section] = start
+         missing.remove(section)
+      if not missing:
+         break
+   return present
 
 # def _find_chunk_pattern(starts, ends, end_prepattern=r'\d\.\s'):
 #     """
@@ -73,35 +201,94 @@ def _find_chunk_pattern(starts, ends, end_prepattern = r'\d+\s'):
     
 #     return pattern
 
-def _motion_processor(club_names, names_and_motions):
-   """Takes in a list of club names for a given chunk and a list of club names and motions. Outputs a dictionary of club names mapped to keys containing the relevant motion. 
-   club_names (list[str]): List of club names (eg. ['V-Day at Berkeley', 'Aion', 'Volunteer Income Tax Assistance Program', 'ASUC Menstrual Equity Commission', 'ASUC Menstrual Equity Commission'])
-   names_and_motions (list[str]): List of club names and motions (eg. ['V-Day at Berkeley', 'Motion to approve $400 by Senator Manzoor', 'Seconded by Senator Ponna', 'Aion', 'Motion to approve $300 by Senator Manzoor ', 'Seconded by Senator Ponna ')
+def _chunk_motions(chunk, debug=True):
+   """
+   Maps each club in a section chunk to its motion lines, in one pass over the lines in the format "<digit><space><anything>".
+   A line is a club name if it is newline-terminated, isn't a Motion/Seconded line and only uses _VALID_NAME_CHARS;
+   every other line is a motion of the club above it.
+   chunk (str): Cleaned text of one agenda section
+   debug (bool): Whether to print a warning for every line skipped before the first club
+   Returns dict[str, list[str]], eg. {'V-Day at Berkeley': ['Motion to approve $400 by Senator Manzoor', 'Seconded by Senator Ponna'], 'Aion': [...]}
    """
-   # print(f"Club Names: {club_names}")
-   # print(f"Club Motions: {names_and_motions}")
    rv = {}
-   repeats = dict(zip(club_names, [0]*len(club_names)))
-   club_set = set(club_names)  
-   curr_club = None
-   for curr in names_and_motions: 
-      if curr in club_set: 
-         if curr in rv: #to register clubs that get repeated in the agenda due to multiple submissions
-            curr_club = curr + f" ({str(repeats[curr] + 1)})"
-         else:
-            curr_club = curr
-         rv[curr_club] = [] #to register clubs with no motions
-      else: 
-         if curr_club is None:
-            print(f"""WARNING line skip occured with line: {curr}
-            total list is: {names_and_motions}""")
-         else:
-            rv[curr_club].append(curr)
+   repeats = {} #earlier appearances of each club in this chunk
+   motions = None #motion list of the current club
+   all_lines = None #full line list for the skip warning, only built if a line is skipped while debugging
+   for m in _LINE_RE.finditer(chunk):
+      line = m.group(1)
+      if m.end(1) < m.end() and not line.startswith(('Motion', 'Seconded')) and _CLUB_NAME_RE.fullmatch(line):
+         seen = repeats.get(line, 0)
+         repeats[line] = seen + 1
+         #to register clubs that get repeated in the agenda due to multiple submissions: 'X', 'X (1)', 'X (2)', ...
+         rv[f"{line} ({seen})" if seen else line] = motions = [] #empty for clubs with no motions
+      elif motions is None:
+         if debug:
+            if all_lines is None:
+               all_lines = _LINE_RE.findall(chunk)
+            print(f"""WARNING line skip occured with line: {line}
+               total list is: {all_lines}""")
+      else:
+         motions.append(line)
 
    return rv
 
+def _decide(motions):
+   """
+   Classifies a club's motion lines into (decision, allocation), scanning each line with _DECISION_RE in order.
+   Precedence is rejections > temporary tabling > partial approval > approval with an amount > approval without one,
+   regardless of which line each motion appears on; the first amount of the winning kind is used.
+   """
+   first = {}
+   for motion in motions:
+      # every _DECISION_RE alternative contains one of these words, so lines like "Seconded by ..." skip the regex scan
+      if 'pprove' not in motion and 'tabl' not in motion and 'deny' not in motion:
+         continue
+      for m in _DECISION_RE.finditer(motion):
+         kind = m.lastgroup
+         if kind == 'denied':
+            return 'Denied or Tabled Indefinetly', 0 #nothing outranks a rejection, stop scanning
+         first.setdefault(kind, m)
+
+   if 'tabled' in first:
+      return 'Tabled', 0
+   if 'partial' in first:
+      # Partially approved - use the amount specified after "partially approve"
+      return 'Partially Approved', first['partial'].group('partial_amt')
+   if 'approve' in first:
+      return 'Approved', first['approve'].group('approve_amt')
+   if 'approve_bare' in first:
+      return 'Approved but dollar amount not listed', np.nan # not listed appends NaN
+   #check if there was no entry on ficomm's decision for a club (sometimes happens due to record keeping errors)
+   if not any(motions):
+      return 'No record on input doc', np.nan
+   return 'ERROR could not find conclusive motion', np.nan
+
+def _nested_amount(sub_motions: str):
+   """
+   Returns the amount of a passed nested-format motion from one scan of _NESTED_AMT_RE, or NaN if none is listed.
+   A waiver amount wins over an allocate amount, which wins over an approve amount, wherever each appears;
+   the first amount of the winning kind is used.
+   """
+   first = {}
+   for m in _NESTED_AMT_RE.finditer(sub_motions):
+      kind = m.lastgroup
+      if kind == 'waiver':
+         return m.group(kind) #nothing outranks a waiver amount, stop scanning
+      first.setdefault(kind, m.group(kind))
+   for kind in ('allocate', 'approve'):
+      if kind in first:
+         return first[kind]
+   return np.nan
+
+def _clean_org_name(name: str):
+   """
+   Removes asterisks and trailing commas/whitespace from an organization name, eg. "Club A*, " -> "Club A"
+   (the trailing whitespace removal also drops the '\r' that can stay at the end of club names).
+   """
+   return _NAME_CLEAN_RE.sub('', name).lstrip()
+
 def inpt_cleaner(inpt: str):
-   inpt = re.sub(r"\(\$?\d+,?\d*\.?\d*\)", "", inpt)
+   inpt = _INPT_CLEAN_RE.sub("", inpt)
    # Periods are already removed at the top level of Agenda_Processor
    return inpt
 
@@ -114,55 +301,38 @@ def _process_2020_nested_format(inpt: str, date: str, debug=True):
    if debug:
       print("Attempting to process as 2020/2021 nested format...")
 
-   # Define section mappings for 2020/2021 format
-   section_map = {
-      'Sponsorship': 'Sponsorship',
-      'Senate Contingency Funding': 'Contingency',
-      'Contingency Funding': 'Contingency',  # Spring 2021 uses this
-      'Contingency': 'Contingency',
-      'Funding': 'Contingency',  # Spring 2020 uses just "Funding"
-      'Space Reservation': 'Space Reservation',
-      'Finance Rule Waiver': 'Finance Rule',  # Spring 2021 uses full name
-      'Finance Rule': 'Finance Rule',
-      'Rule Waiver': 'Rule Waiver',
-      'ABSA Appeals': 'ABSA Appeals'
-   }
-
-   list_of_dfs = []
+   # Column lists accumulated across every section; the frame is built once at the end
+   all_names, all_status, all_amounts = [], [], []
+   section_types, section_sizes = [], []
 
    # Try to find and extract Pending Business section
-   pending_pattern = r'Pending Business.*?(?=\d+\s+Adjournment|\d+\s+Guest|$)'
-   pending_match = re.search(pending_pattern, inpt, re.DOTALL | re.IGNORECASE)
+   pending_match = _PENDING_BUSINESS_RE.search(inpt)
 
    if not pending_match:
       if debug:
          print("No Pending Business section found")
       return None
 
-   pending_section = pending_match.group(0)
+   pending_section = _slice_until(inpt, pending_match.start(), _PENDING_END_RE)
    if debug:
       print(f"Found Pending Business section (length: {len(pending_section)})")
 
    # Check if there's a Finance Rule subsection (FR 20/21 S##) that contains the actual sections
    # Some Spring 2021 files have this double-nested structure
    # Need to capture until we hit the next top-level item (minimal indent + number)
-   fr_pattern = r'\d+\s+FR \d+/\d+ S\d+\s*\n(.*?)(?=\n\s{0,3}\d+\s+[A-Z]|$)'
-   fr_match = re.search(fr_pattern, pending_section, re.DOTALL | re.IGNORECASE)
+   fr_match = _FR_HEADER_RE.search(pending_section)
    if fr_match:
       # Use the FR subsection content as the base for extraction
-      pending_section = fr_match.group(1)
+      pending_section = _slice_until(pending_section, fr_match.end(), _FR_END_RE)
       if debug:
          print(f"Found FR subsection, using it instead (length: {len(pending_section)})")
 
    # Process each subsection type
-   for section_name, request_type in section_map.items():
-      # Pattern to match section and its content until next section at same indentation level
-      # Sections are numbered like "1. Sponsorship", "2. Senate Contingency Funding"
-      # We want to capture everything until the next section at the same level (minimal indent + number)
-      # More specific: capture until we hit another section name from our map
-      other_sections = '|'.join([re.escape(s) for s in section_map.keys() if s != section_name])
-      section_pattern = rf'(\d+)\s+{re.escape(section_name)}\s*\n(.*?)(?=\n\s{{0,8}}\d+\s+(?:{other_sections})|$)'
-      section_match = re.search(section_pattern, pending_section, re.DOTALL | re.IGNORECASE)
+   present = {m.group(1).lower() for m in _NESTED_HEADER_RE.finditer(pending_section)}
+   for section_name, request_type in _NESTED_SECTION_MAP.items():
+      if section_name.lower() not in present:
+         continue
+      section_match = _NESTED_SECTION_RES[section_name].search(pending_section)
 
       if not section_match:
          continue
@@ -188,13 +358,15 @@ def _process_2020_nested_format(inpt: str, date: str, debug=True):
          # Single-nested (Fall 2020): 6 spaces for orgs, 9+ for motions
          # Double-nested (Spring 2021): 9 spaces for orgs, 12+ for motions
          # We'll try to detect both patterns
-         org_match = re.match(r'^\s{6,10}(\d+)\s+(.+)', line)
+         # the indent band and leading digit are checked with plain str operations, so most lines never reach the regex
+         stripped = line.lstrip()
+         indent = len(line) - len(stripped)
+         org_match = _ORG_LINE_RE.match(stripped) if 6 <= indent <= 10 and stripped[:1].isdecimal() else None
          if org_match:
-            indent = len(line) - len(line.lstrip())
             org_name = org_match.group(2).strip()
 
             # Only treat as org if not a motion/second/senator line or FR passing line
-            if not re.match(r'(Motion|Second|Senator.*motions?\s+to\s+(pass|send)\s+FR)', org_name, re.IGNORECASE):
+            if not _NOT_ORG_RE.match(org_name):
                # Handle duplicate org names by appending a count
                if org_name in org_counts:
                   org_counts[org_name] += 1
@@ -208,12 +380,11 @@ def _process_2020_nested_format(inpt: str, date: str, debug=True):
                org_contents[current_org] = []
                if debug:
                   print(f"  Found org: {current_org}")
-         elif current_org and line.strip():
+         elif current_org and stripped:
             # This is content under the current org (motions, etc.)
             # Sub-items have deeper indentation than the org
-            indent = len(line) - len(line.lstrip())
             if indent > current_org_indent:
-               org_contents[current_org].append(line.strip())
+               org_contents[current_org].append(stripped.rstrip())
 
       # Process decisions and allocations
       decisions = []
@@ -227,40 +398,30 @@ def _process_2020_nested_format(inpt: str, date: str, debug=True):
             print(f"  {org_name}: {sub_motions[:100]}")
 
          # Determine decision
-         if re.search(r'(tabled?\sindefinetly)|(tabled?\sindefinitely)|(table\sindefinitely)|(deny)|not present.*tabled', sub_motions, re.IGNORECASE):
+         # every denial/tabling alternative contains 'deny' or 'tabl' and every motion one contains 'mot', so plain substring
+         # checks on the lowercased text rule most patterns out before their regex scan
+         lowered = sub_motions.lower()
+         has_tabl = 'tabl' in lowered
+         if (has_tabl or 'deny' in lowered) and _NESTED_DENIED_RE.search(sub_motions):
             decisions.append('Denied or Tabled Indefinetly')
             allocations.append(0)
-         elif re.search(r'(tabled?\suntil)|(tabled?\sfor)|(tabled?\sto)|(table\sto)|(tabled to next week)|not present.*tabled', sub_motions, re.IGNORECASE):
+         elif has_tabl and _NESTED_TABLED_RE.search(sub_motions):
             decisions.append('Tabled')
             allocations.append(0)
-         elif re.search(r'(motion\s+(passes|passed|approved))|(motions?\s+to\s+(sponsor|approve|amend))', sub_motions, re.IGNORECASE):
+         elif 'mot' in lowered and _NESTED_MOTION_RE.search(sub_motions):
             # Spring 2020 format: "motions to approve the waiver for $X" then "Motion passes/passed/approved"
             # Or: "motions to sponsor" then "Motion passes"
             # Or: "motions to amend the FR to allocate $X" then "Motion passes"
 
             # Check if motion actually passed/approved
-            if re.search(r'motion\s+(passed|approved)', sub_motions, re.IGNORECASE):
-               # Extract dollar amounts - check various patterns
+            if _NESTED_PASSED_RE.search(sub_motions):
+               # Extract dollar amounts - first hit wins, checking the patterns in order:
                # Pattern 1: "waiver for $X"
-               waiver_amount = re.findall(r'waiver\s+for\s+\$?(\d+(?:,\d+)?(?:\.\d+)?)', sub_motions, re.IGNORECASE)
                # Pattern 2: "allocate $X"
-               allocate_amount = re.findall(r'allocate\s+\$?(\d+(?:,\d+)?(?:\.\d+)?)', sub_motions, re.IGNORECASE)
                # Pattern 3: "approve $X" or "approve X" (without dollar sign)
-               approve_amount = re.findall(r'approve\s+(?:for\s+)?\$?(\d+(?:,\d+)?(?:\.\d+)?)', sub_motions, re.IGNORECASE)
-
-               if waiver_amount:
-                  decisions.append('Approved')
-                  allocations.append(waiver_amount[0])
-               elif allocate_amount:
-                  decisions.append('Approved')
-                  allocations.append(allocate_amount[0])
-               elif approve_amount:
-                  decisions.append('Approved')
-                  allocations.append(approve_amount[0])
-               else:
-                  # Approved but no dollar amount (e.g., sponsorship)
-                  decisions.append('Approved')
-                  allocations.append(np.nan)
+               decisions.append('Approved')
+               # Approved but no dollar amount (e.g., sponsorship) -> NaN
+               allocations.append(_nested_amount(sub_motions))
             else:
                # Motion was made but didn't pass
                decisions.append('ERROR could not find conclusive motion')
@@ -273,28 +434,50 @@ def _process_2020_nested_format(inpt: str, date: str, debug=True):
             allocations.append(np.nan)
 
       if orgs:
-         df = pd.DataFrame({
-            'Org Name': pd.Series(orgs).str.strip(),
-            'Request Type': [request_type] * len(orgs),
-            'Committee Status': decisions,
-            'Amount': allocations,
-            'Date': [date] * len(orgs),
-         })
-         list_of_dfs.append(df)
+         all_names.extend(map(_clean_org_name, orgs))
+         all_status.extend(decisions)
+         all_amounts.extend(allocations)
+         section_types.append(request_type)
+         section_sizes.append(len(orgs))
          if debug:
-            print(f"Created DataFrame for {section_name} with {len(orgs)} organizations")
+            print(f"Collected {len(orgs)} organizations for {section_name}")
 
-   if list_of_dfs:
-      result = pd.concat(list_of_dfs, ignore_index=True)
-      return result
+   if all_names:
+      return pd.DataFrame({
+         'Org Name': all_names,
+         'Request Type': np.repeat(np.array(section_types, dtype=object), section_sizes),
+         'Committee Status': all_status,
+         'Amount': all_amounts,
+         'Date': date,
+      })
 
    return None
 
 
+_AGENDA_DATE_FORMATS = ("%B %d, %Y", "%b %d, %Y") # "March 3, 2025" / "Mar 3, 2025"
+
+def _parse_agenda_date(date_str):
+   """Parses an agenda date with strptime on the usual formats, falling back to pd.to_datetime (eg. for "March 3rd, 2025")."""
+   for fmt in _AGENDA_DATE_FORMATS:
+      try:
+         return datetime.strptime(date_str, fmt)
+      except ValueError:
+         pass
+   return pd.to_datetime(date_str, errors='coerce')
+
+_DEFAULT_START = ('Contingency', 'Finance Rule', 'Rule Waiver', 'Space Reservation')
+_DEFAULT_END = ('Finance Rule', 'Rule Waiver', 'Space Reservation', 'Sponsorship', 'Adjournment', 'ABSA', 'ABSA Appeals')
+_DEFAULT_START_END_DICT = {s: _DEFAULT_END[i:] for i, s in enumerate(_DEFAULT_START)} # start keyword -> the end keywords that can close its chunk
+# every Committee Status either format can produce; a fixed category set keeps the column categorical when frames from
+# several agendas are concatenated (pd.concat falls back to object if the categories differ)
+_COMMITTEE_STATUS_DTYPE = pd.CategoricalDtype([
+   'Approved', 'Partially Approved', 'Approved but dollar amount not listed', 'Tabled', 'Denied or Tabled Indefinetly',
+   'No record on input doc', 'ERROR could not find conclusive motion'])
+
 def Agenda_Processor(inpt: str,
-                     start=['Contingency', 'Finance Rule', 'Rule Waiver', 'Space Reservation'],
-                     end=['Finance Rule', 'Rule Waiver', 'Space Reservation', 'Sponsorship', 'Adjournment', 'ABSA', 'ABSA Appeals'],
-                     identifier=r'(?:\w+,\s)?(\w+\s\d{1,2}\w*,\s\d{4})',
+                     start=_DEFAULT_START,
+                     end=_DEFAULT_END,
+                     identifier=_DATE_IDENTIFIER,
                      date_format="%m/%d/%Y",
                      debug=True):
    """
@@ -304,126 +487,97 @@ def Agenda_Processor(inpt: str,
    input (str): The raw text of the agenda to be processed. Usually a .txt file
    identifier (str): Regex pattern to extract a certain piece of text from inpt as the identifier for the chunk extracted from inpt
    """
+   # Check if this is a nested format (2020/2021 style with Pending Business)
+   # If so, skip modern format processing and go straight to nested format
+   # (neither marker can be changed by the preprocessing below, so the raw text is checked)
+   has_pending_business = _PENDING_BUSINESS_RE.search(inpt)
+   has_nested_sections = _NESTED_SECTIONS_RE.search(inpt)
+   is_nested = has_pending_business and has_nested_sections
+
    # Remove periods only from numbered list markers (e.g., "1." -> "1 "), preserving decimal numbers like "$43.72"
    # Pattern: digit(s) followed by period followed by whitespace (list markers)
-   inpt = re.sub(r'(\d+)\.(\s)', r'\1\2', inpt)
+   # Modern-format agendas also lose their parenthesized amounts in the same pass, so chunks come out already cleaned
+   raw_inpt = inpt
+   inpt = _LIST_MARKER_RE.sub('', inpt) if is_nested else _PREPROCESS_RE.sub('', inpt)
 
-   date_match = re.findall(rf"{identifier}", inpt)
-   if not date_match:
+   date_re = _DATE_IDENTIFIER_RE if identifier == _DATE_IDENTIFIER else _identifier_re(identifier)
+   date_match = date_re.search(inpt)
+   if date_match is None:
       print(f"Agenda_Processor could not find date on agenda doc")
       date = "00/00/0000"
    else:
-      date_str = date_match[0]  # the matched date string
-      dt = pd.to_datetime(date_str, errors='coerce')  # parse string into timestamp object
+      date_str = date_match.group(1 if date_re.groups else 0)  # the matched date string
+      dt = _parse_agenda_date(date_str)  # parse string into datetime/timestamp object
       date = dt.strftime(date_format)
-   # Check if this is a nested format (2020/2021 style with Pending Business)
-   # If so, skip modern format processing and go straight to nested format
-   has_pending_business = re.search(r'Pending Business', inpt, re.IGNORECASE)
-   has_nested_sections = re.search(r'Pending Business.*?(Contingency Funding|Senate Contingency Funding|Finance Rule Waiver)', inpt, re.DOTALL | re.IGNORECASE)
 
    #Building key/value dictionary
-   start_end_dict = {}
-   for i in range(len(start)):
-      start_end_dict[start[i]] = end[i:]
-   list_of_dfs = []
+   if start is _DEFAULT_START and end is _DEFAULT_END:
+      start_end_dict = _DEFAULT_START_END_DICT
+   else:
+      end = tuple(end) # tuple slices can key the compiled chunk pattern cache directly
+      start_end_dict = {s: end[i:] for i, s in enumerate(start)}
+   # Column lists accumulated across every section; the frame is built once after the loop
+   all_names, all_status, all_amounts = [], [], []
+   section_types, section_sizes = [], [] #one entry per found section, expanded into Request Type once at the end
+   found_section = False
+   # bound once so the per-club classification loop below avoids repeated global/attribute lookups
+   status_append, amount_append = all_status.append, all_amounts.append
+   decide, nan = _decide, np.nan
    rv = None  # Initialize rv to avoid UnboundLocalError
 
    # Skip modern format if we detect nested structure
-   if has_pending_business and has_nested_sections:
+   if is_nested:
       if debug:
          print("Detected nested format (2020/2021), skipping modern format processing")
    else:
+      present = _present_sections(inpt, tuple(start_end_dict))
       for s in start_end_dict:
-         if re.findall(rf"\d+\s{s}", inpt):
+         if s in present:
 
 
-            pattern = _find_chunk_pattern(starts = [s], ends = start_end_dict[s])
+            chunk_re = _compiled_chunk_pattern((s,), start_end_dict[s])
             if debug:
-               print(f"Agenda Processor Pattern: {pattern}")
-
-            chunk = re.findall(rf"{pattern}", inpt)[0]
-            chunk = inpt_cleaner(chunk)
-            print(f"chunk: {chunk}")
+               print(f"Agenda Processor Pattern: {chunk_re.pattern}")
 
-            valid_name_chars = r'\w\s\-\_\*\&\%\$\+\#\@\!\(\)\,\'\"\[\]\.:' #seems to perform better with explicit handling for special characters? eg. for 'Telegraph+' we add the plus sign so regex will pick it up. Added \[\] for brackets and \. for periods in names like "Inc."
-            club_name_pattern = rf'\d+\s(?!Motion|Seconded)([{valid_name_chars}]+?)(?=\n)' #matches numbered items that are club names (not Motion/Seconded), capturing until newline
-            club_names = list(re.findall(club_name_pattern, chunk)) #just matches club names --> list of tuples of club names
+            chunk_match = chunk_re.search(inpt, present[s]) #starts at the section's numbered marker
+            if chunk_match is None:
+               continue #no end keyword after the section
+            chunk = chunk_match.group(1) #already cleaned by _PREPROCESS_RE
             if debug:
-               print(f"Agenda Processor Club Names: {club_names}")
+               print(f"chunk: {chunk}")
 
-            names_and_motions = list(re.findall(rf'\d+\s(.+)\n?', chunk)) #pattern matches every single line that comes in the format "<digit><space><anything>""
-            motion_dict = _motion_processor(club_names, names_and_motions)
+            motion_dict = _chunk_motions(chunk, debug=debug)
             if debug:
                print(f"Agenda Processor Motion Dict: {motion_dict}")
 
 
-            decisions = []
-            allocations = []
-            for name in motion_dict.keys():
-
-               if motion_dict[name] == []:
-                  decisions.append('No record on input doc')
-                  allocations.append(np.nan)
+            found_section = True
+            all_names.extend(map(_clean_org_name, motion_dict))
+            section_types.append(s)
+            section_sizes.append(len(motion_dict))
+            for motions in motion_dict.values():
+               if not motions:
+                  status_append('No record on input doc')
+                  amount_append(nan)
 
                else:
-                  sub_motions = " ".join(motion_dict[name]) #flattens list of string motions into one massive continuous string containing all motions
-                  print(f'sub-motions: {sub_motions}')
+                  if debug:
+                     print(f'sub-motions: {motions}')
 
                   #for handling multiple conflicting motions (which shouldn't even happen) we record rejections > temporary tabling > approvals > no input
                   #when in doubt assume rejection
-                  #check if application was denied or tabled indefinetly
-                  if re.findall(r'(tabled?\sindefinetly)|(tabled?\sindefinitely)|(deny)', sub_motions) != []:
-                     decisions.append('Denied or Tabled Indefinetly')
-                     allocations.append(0)
-                  #check if the application was tabled
-                  elif re.findall(r'(tabled?\suntil)|(tabled?\sfor)|(tabled?\sto)', sub_motions) != []:
-                     decisions.append('Tabled')
-                     allocations.append(0)
-                  #check if application was approved and for how much
-                  elif re.findall(r'[aA]pprove', sub_motions) != []:
-                     # Check for partial approval first (more specific pattern)
-                     # Handles: "partially approve $X" or "partially approve for $X"
-                     partial_match = re.findall(r'[pP]artially\s+[aA]pprove\s+(?:for\s+)?\$?(\d+(?:,\d+)?(?:\.\d+)?)', sub_motions)
-                     # Check for regular approval
-                     dollar_amount = re.findall(r'[aA]pprove\s+(?:for\s+)?\$?(\d+(?:,\d+)?(?:\.\d+)?)', sub_motions)
-
-                     if partial_match != []:
-                        # Partially approved - use the amount specified after "partially approve"
-                        decisions.append('Partially Approved')
-                        allocations.append(partial_match[0])
-                     elif dollar_amount != []:
-                        decisions.append('Approved')
-                        allocations.append(dollar_amount[0])
-                     else:
-                        decisions.append('Approved but dollar amount not listed')
-                        allocations.append(np.nan) # not listed appends NaN
-                  #check if there was no entry on ficomm's decision for a club (sometimes happens due to record keeping errors)
-                  elif sub_motions == '':
-                     decisions.append('No record on input doc')
-                     allocations.append(np.nan)
-                  else:
-                     decisions.append('ERROR could not find conclusive motion')
-                     allocations.append(np.nan)
-
-            rv = pd.DataFrame({
-               'Org Name' : pd.Series(motion_dict.keys()).str.strip(), #solves issue of '\r' staying at the end of club names and messing things up
-               "Request Type": [s] * len(allocations),
-               'Committee Status' : decisions,
-               'Amount' : allocations,
-               'Date' : [date]*len(allocations),
-               }
-            )
-
-            list_of_dfs.append(rv)
+                  decision, allocation = decide(motions) #scans the motion lines in place, no joined copy
+                  status_append(decision)
+                  amount_append(allocation)
 
    # Handle case where no matching sections were found
-   if not list_of_dfs:
+   if not found_section:
       if debug:
          print(f"Agenda Processor: No matching sections found in modern format")
          print(f"Attempting 2020 nested format processing...")
 
-      # Try 2020 nested format
-      rv = _process_2020_nested_format(inpt, date, debug=debug)
+      # Try 2020 nested format, which keeps parenthesized amounts
+      rv = _process_2020_nested_format(inpt if is_nested else _LIST_MARKER_RE.sub('', raw_inpt), date, debug=debug)
 
       if rv is None or rv.empty:
          if debug:
@@ -433,14 +587,40 @@ def Agenda_Processor(inpt: str,
          if debug:
             print(f"Successfully processed using 2020 nested format: {len(rv)} organizations found")
    else:
+      rv = pd.DataFrame({
+         'Org Name' : np.array(all_names, dtype=object), #object array keeps Org Name object-typed even when a found section lists no clubs, without an interim Series
+         'Request Type' : np.repeat(np.array(section_types, dtype=object), section_sizes),
+         'Committee Status' : all_status,
+         'Amount' : all_amounts,
+         'Date' : date,
+         }
+      )
       if debug:
          print(f"Agenda Processor Final df: {rv}")
-      rv = pd.concat(list_of_dfs)
 
-   # Clean up organization names: remove asterisks and trailing commas/whitespace
-   if not rv.empty:
-      rv["Org Name"] = rv["Org Name"].str.replace("*", "", regex=False)
-      rv["Org Name"] = rv["Org Name"].str.replace(r',\s*$', '', regex=True)
-      rv["Org Name"] = rv["Org Name"].str.strip()
+   # A handful of labels repeated on every row are stored as categories; Amount mixes strings like "1,000", 0 and NaN,
+   # so it becomes one nullable float column (which also lets it round-trip through Parquet)
+   # Request Type and Committee Status get fixed category sets (the section keywords / every possible decision), so frames
+   # from agendas processed with the same start keywords stay categorical when concatenated
+   rv['Request Type'] = rv['Request Type'].astype(pd.CategoricalDtype(dict.fromkeys((*start_end_dict, *_NESTED_SECTION_MAP.values()))))
+   rv['Committee Status'] = rv['Committee Status'].astype(_COMMITTEE_STATUS_DTYPE)
+   rv['Date'] = rv['Date'].astype('category')
+   rv['Amount'] = pd.to_numeric(rv['Amount'].replace(',', '', regex=True), errors='coerce').astype('Float64')
 
    return rv, date
+
+def Agenda_Processor_batch(inpts, max_workers=None, **kwargs):
+   """
+   Runs Agenda_Processor over several agenda texts in worker processes; the regex work holds the GIL, so threads
+   wouldn't overlap it. Results come back as a list of (df, date) pairs in input order.
+
+   inpts (iterable[str]): Raw agenda texts
+   max_workers (int): Worker process count (None lets ProcessPoolExecutor pick); 1, or a single agenda, runs in this process
+   kwargs: Passed on to Agenda_Processor for every agenda; debug defaults to False so workers don't interleave their prints
+   """
+   inpts = list(inpts)
+   kwargs.setdefault('debug', False)
+   if max_workers == 1 or len(inpts) <= 1:
+      return [Agenda_Processor(inpt, **kwargs) for inpt in inpts]
+   with ProcessPoolExecutor(max_workers=max_workers) as pool:
+      return list(pool.map(functools.partial(Agenda_Processor, **kwargs), inpts))
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import re
 from datetime import datetime
@@ -5,17 +6,32 @@ import argparse
 from ASFINT.Utility.Utils import heading_finder
 from ASFINT.Utility.Cleaning import in_df
 
-def _row_has(tokens, row) -> bool:
-    """Return True if all tokens are present in the given row (as strings)."""
-    s = set(str(x).strip() for x in row.tolist())
-    return all(t in s for t in tokens)
+# Date and filename patterns, compiled once at import
+_MDY_RE = re.compile(r'(\d{2}/\d{2}/\d{4})')
+_YMD_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+_DATE_RE = re.compile(r"(\d{2}/\d{2}/\d{4}|\d{4}-\d{2}-\d{2})")
+_FILENAME_PAREN_RE = re.compile(r"\([\d]+\)") # copy markers like "(1)", "(2)"
+
+# Allowed FY24 appendix labels (A-Z, AA-AZ, BA-BZ), built once at import
+_UPPER = tuple(chr(c) for c in range(65, 91))
+_FY24_ALPHABET = frozenset(_UPPER + tuple(f"A{c}" for c in _UPPER) + tuple(f"B{c}" for c in _UPPER))
+
+# Columns FR_Helper keeps next to the Requested / Approved+Committee columns of each split table
+_REQUEST_KEEP = frozenset(["Appx", "Org Name", "Request Type", "Org Type", "Funding Source", "Primary Contact", "Email Address"])
+_DECISION_KEEP = frozenset(["Appx", "Org Name"])
+
+def _rows_having(cells: np.ndarray, tokens) -> np.ndarray:
+    """Boolean mask over the rows of a 2D array of stripped cell strings: True where the row contains every token."""
+    mask = np.ones(len(cells), dtype=bool)
+    for t in tokens:
+        mask &= (cells == t).any(axis=1)
+    return mask
 
 def _promote_header(block: pd.DataFrame, header_row_idx: int) -> pd.DataFrame:
     """Use the values of header_row_idx as column names and return rows beneath it."""
     header = block.loc[header_row_idx].astype(str).str.strip().tolist()
-    out = block.loc[header_row_idx + 1 :].copy()
+    out = block.loc[header_row_idx + 1 :].reset_index(drop=True) # reset_index already returns a new frame, no separate copy needed
     out.columns = header
-    out = out.reset_index(drop=True)
     return out
 
 def _sanitize_date_for_filename(date_str: str) -> str:
@@ -29,21 +45,14 @@ def FR_Helper(df):
     Both are cropped starting at 'Appx' and filtered by allowed FY24 alphabet.
     """
     # Find starting point (first "Appx")
-    start_idx = df.index[df.iloc[:, 0].astype(str).str.contains("Appx", na=False)]
+    start_idx = df.index[df.iloc[:, 0].astype(str).str.contains("Appx", regex=False, na=False)]
     if len(start_idx) == 0:
         return df, None, None
     start = start_idx[0]
 
-    # Allowed labels (A-Z, AA-AZ, BB-ZZ)
-    allowed = set(
-        [chr(c) for c in range(65, 91)] +
-        [f"A{chr(c)}" for c in range(65, 91)] +
-        [f"B{chr(c)}" for c in range(65, 91)]
-    )
-
     # Crop to rows after "Appx"
-    cropped = df.iloc[start + 1:].copy()
-    cropped = cropped[cropped.iloc[:, 0].astype(str).isin(allowed)]
+    cropped = df.iloc[start + 1:]
+    cropped = cropped[cropped.iloc[:, 0].astype(str).isin(_FY24_ALPHABET)] # the boolean filter makes the one copy
 
     # Now split into two subtables: requests vs committee decisions
     # Assumption: the raw file stacks two tables vertically with same headers
@@ -52,39 +61,37 @@ def FR_Helper(df):
         # Already unified, rare case
         return cropped, None, None
 
-    # Otherwise, detect split by column names
-    request_cols = [c for c in cropped.columns if "Requested" in str(c)]
-    decision_cols = [c for c in cropped.columns if "Approved" in str(c) or "Committee" in str(c)]
+    # Otherwise, detect split by column names (one vectorized pass over the column labels)
+    cols = cropped.columns
+    names = cols.astype(str)
+    request_cols = names.str.contains("Requested", regex=False)
+    decision_cols = names.str.contains("Approved", regex=False) | names.str.contains("Committee", regex=False)
 
-    if not request_cols or not decision_cols:
+    if not request_cols.any() or not decision_cols.any():
         # Could not split
         return cropped, None, None
 
-    requests_df = cropped.loc[:, [c for c in cropped.columns if "Requested" in str(c) or c in ["Appx", "Org Name", "Request Type", "Org Type", "Funding Source", "Primary Contact", "Email Address"]]]
-    decisions_df = cropped.loc[:, [c for c in cropped.columns if "Approved" in str(c) or "Committee" in str(c) or c in ["Appx", "Org Name"]]]
+    requests_df = cropped.loc[:, request_cols | cols.isin(_REQUEST_KEEP)]
+    decisions_df = cropped.loc[:, decision_cols | cols.isin(_DECISION_KEEP)]
 
     return cropped, requests_df, decisions_df
 
-def FR_ProcessorV2(df: pd.DataFrame, txt: str, date_format: str, original_filename: str = None):
-    """
-    Merge FR sheet's two stacked tables by ['Appx.', 'Org Name']:
-      - Table 1 is preserved (columns/values untouched)
-      - Table 2 contributes 'Amount' and 'Committee Status'
-    Output columns (when present):
-      ['Appx.', 'Org Name', 'Request Type', 'Org Type (year)',
-       'Amount Requested', 'Amount', 'Committee Status',
-       'Funding Source', 'Primary Contact', 'Email Address', 'Date']
+def _compute_out_name(extracted_date: str, original_filename: str = None) -> str:
+    """Output key for one FR sheet: "{original_filename} Cleaned" if given, else "FR_clean_{date}"."""
+    if original_filename:
+        # Use original filename with "Cleaned" suffix
+        # Remove common file extensions and clean up
+        base_name = original_filename.replace(".csv", "").replace(".xlsx", "").replace(".gsheet", "")
+        base_name = _FILENAME_PAREN_RE.sub("", base_name).strip()  # Remove (1), (2), etc.
+        base_name = base_name.replace(" - Sheet1", "").replace("- Sheet1", "").strip()
+        return f"{base_name} Cleaned"
+    # Fall back to date-based naming
+    safe_date = _sanitize_date_for_filename(extracted_date)
+    return f"FR_clean_{safe_date}"
 
-    Args:
-        df: Input DataFrame
-        txt: Companion text (used for date extraction if original_filename not provided)
-        date_format: Date format string (e.g., "%m/%d/%Y")
-        original_filename: Optional original filename. If provided, output will be named
-                          "{original_filename} Cleaned" instead of "FR_clean_{date}"
 
-    Returns:
-        Dict[str, pd.DataFrame]: Dictionary with single key-value pair {out_name: processed_df}
-    """
+def _process_frame(df: pd.DataFrame, txt: str, date_format: str, original_filename: str = None):
+    """Does the work of FR_ProcessorV2, returning an (out_name, processed_df) tuple instead of a single-entry dict."""
     # 1) Extract date from the input data
     # The date can appear in the first several rows in formats like:
     # - "YYYY-MM-DD Finance Committee Agenda and Minutes"
@@ -92,42 +99,28 @@ def FR_ProcessorV2(df: pd.DataFrame, txt: str, date_format: str, original_filena
     # Check the first 10 rows to find the date
     extracted_date = None
     if df is not None and not df.empty:
-        # Check first 10 rows for date pattern
-        rows_to_check = []
-        for i in range(min(10, len(df))):
-            rows_to_check.append(df.iloc[i])
-
-        for row in rows_to_check:
-            row_values = row.astype(str).tolist()
-            for val in row_values:
-                # Look for MM/DD/YYYY pattern first (more common in FR files)
-                date_match = re.search(r'(\d{2}/\d{2}/\d{4})', val)
-                if date_match:
+        # Both patterns are extracted from every cell of the first 10 rows at once (cells in row order);
+        # only cells with a hit are then parsed, MM/DD/YYYY first, until one is a valid date
+        cells = pd.Series(df.iloc[:10].astype(str).to_numpy().ravel())
+        hits = pd.DataFrame({
+            "%m/%d/%Y": cells.str.extract(_MDY_RE, expand=False),  # MM/DD/YYYY is more common in FR files
+            "%Y-%m-%d": cells.str.extract(_YMD_RE, expand=False),
+        }).dropna(how="all")
+        for row in hits.itertuples(index=False):
+            for fmt, date_str in zip(hits.columns, row):
+                if isinstance(date_str, str):
                     try:
                         # Parse and reformat to the desired format
-                        date_obj = datetime.strptime(date_match.group(1), "%m/%d/%Y")
-                        extracted_date = date_obj.strftime(date_format)
+                        extracted_date = datetime.strptime(date_str, fmt).strftime(date_format)
                         break
                     except ValueError:
                         pass
-
-                # If MM/DD/YYYY not found, try YYYY-MM-DD pattern
-                if not extracted_date:
-                    date_match = re.search(r'(\d{4}-\d{2}-\d{2})', val)
-                    if date_match:
-                        try:
-                            # Parse and reformat to the desired format
-                            date_obj = datetime.strptime(date_match.group(1), "%Y-%m-%d")
-                            extracted_date = date_obj.strftime(date_format)
-                            break
-                        except ValueError:
-                            pass
             if extracted_date:
                 break
 
     # if prev case doesnt work: try to extract from txt parameter
     if extracted_date is None and txt:
-        m = re.search(r"(\d{2}/\d{2}/\d{4}|\d{4}-\d{2}-\d{2})", str(txt))
+        m = _DATE_RE.search(str(txt))
         if m:
             try:
                 # Try to parse the found date
@@ -145,47 +138,34 @@ def FR_ProcessorV2(df: pd.DataFrame, txt: str, date_format: str, original_filena
         extracted_date = "undated"
 
     # 2) determine output name
-    if original_filename:
-        # Use original filename with "Cleaned" suffix
-        # Remove common file extensions and clean up
-        base_name = original_filename.replace(".csv", "").replace(".xlsx", "").replace(".gsheet", "")
-        base_name = re.sub(r"\([\d]+\)", "", base_name).strip()  # Remove (1), (2), etc.
-        base_name = base_name.replace(" - Sheet1", "").replace("- Sheet1", "").strip()
-        out_name = f"{base_name} Cleaned"
-    else:
-        # Fall back to date-based naming
-        safe_date = _sanitize_date_for_filename(extracted_date)
-        out_name = f"FR_clean_{safe_date}"
+    out_name = _compute_out_name(extracted_date, original_filename)
 
     if df is None or df.empty:
-        return {out_name: pd.DataFrame()}
+        return out_name, pd.DataFrame()
 
     # 2) start scan near first "Appx" occurrence in first column
-    start_idx = 0
-    for i in range(min(len(df), 200)):
-        v = str(df.iloc[i, 0])
-        if "Appx" in v:
-            start_idx = i
-            break
+    hits = df.iloc[:200, 0].astype(str).str.contains("Appx", regex=False).to_numpy()
+    start_idx = int(hits.argmax()) if hits.any() else 0
     sheet = df.iloc[start_idx:].reset_index(drop=True)
 
     # 3) detect header rows for table1 (requests) and table2 (decisions)
-    t1_hdr = t2_hdr = None
+    # the scanned rows are stringified and stripped once, then each header is a row mask over that block
     scan_limit = min(100, len(sheet))
-    for i in range(scan_limit):
-        row = sheet.iloc[i]
-        if t1_hdr is None and _row_has(["Appx.", "Org Name", "Amount Requested"], row):
-            t1_hdr = i
-            continue
-        # table2 header can vary; accept either Committee Status or Amount
-        if _row_has(["Appx.", "Org Name", "Committee Status"], row) or _row_has(["Appx.", "Org Name", "Amount"], row):
-            t2_hdr = i
-            if t1_hdr is not None and t2_hdr > t1_hdr:
-                break
+    cells = np.char.strip(sheet.iloc[:scan_limit].astype(str).to_numpy(dtype=str))
+    t1_rows = np.flatnonzero(_rows_having(cells, ["Appx.", "Org Name", "Amount Requested"]))
+    t1_hdr = int(t1_rows[0]) if t1_rows.size else None
+    # table2 header can vary; accept either Committee Status or Amount
+    t2_rows = np.flatnonzero(_rows_having(cells, ["Appx.", "Org Name", "Committee Status"]) | _rows_having(cells, ["Appx.", "Org Name", "Amount"]))
+    if t1_hdr is not None:
+        t2_rows = t2_rows[t2_rows != t1_hdr]
+        after = t2_rows[t2_rows > t1_hdr]
+        if after.size:
+            t2_rows = after[:1] # the first table2 header below table1's
+    t2_hdr = int(t2_rows[-1]) if t2_rows.size else None # otherwise the last one seen, as the old row-by-row scan kept
 
     # if we can't find table headers, return the sheet as-is
     if t1_hdr is None:
-        return {out_name: sheet}
+        return out_name, sheet
 
     # if there's only one table (no table2), promote table1's header and return it
     if t2_hdr is None or t2_hdr <= t1_hdr:
@@ -199,7 +179,7 @@ def FR_ProcessorV2(df: pd.DataFrame, txt: str, date_format: str, original_filena
             table1.rename(columns={"Email": "Email Address"}, inplace=True)
         # Add Date column
         table1['Date'] = extracted_date
-        return {out_name: table1}
+        return out_name, table1
 
     # 4) promote headers and slice blocks
     table1 = _promote_header(sheet, t1_hdr)
@@ -230,14 +210,18 @@ def FR_ProcessorV2(df: pd.DataFrame, txt: str, date_format: str, original_filena
 
     # 7) build the right (table2) with only the two fields we want to add
     right_keep = ["Appx.", "Org Name", "Amount", "Committee Status"]
-    right = table2[[c for c in right_keep if c in table2.columns]].copy()
+    right = table2[[c for c in right_keep if c in table2.columns]] # only read by the merge below
 
     # 8) merge (left-join; do not alter left values)
     join_keys = [k for k in ["Appx.", "Org Name"] if k in left.columns and k in right.columns]
     if len(join_keys) < 2:
         merged = left  # cannot join reliably; return table1 only
     else:
-        merged = left.merge(right, on=join_keys, how="left")
+        # both sides' keys share one category set so the join matches integer codes instead of hashing strings;
+        # the keys go back to table1's dtypes afterwards so left values come out untouched
+        key_dtypes = {k: pd.CategoricalDtype(pd.Categorical(pd.concat([left[k], right[k]], ignore_index=True)).categories) for k in join_keys}
+        merged = left.astype(key_dtypes, copy=False).merge(right.astype(key_dtypes, copy=False), on=join_keys, how="left", sort=False, copy=False)
+        merged = merged.astype({k: left[k].dtype for k in join_keys}, copy=False)
 
     # 9) Add Date column to the merged data
     merged['Date'] = extracted_date
@@ -248,7 +232,31 @@ def FR_ProcessorV2(df: pd.DataFrame, txt: str, date_format: str, original_filena
                   "Funding Source", "Primary Contact", "Email Address", "Date"]
     final = merged[[c for c in final_cols if c in merged.columns]].copy()
 
-    return {out_name: final}
+    return out_name, final
+
+
+def FR_ProcessorV2(df: pd.DataFrame, txt: str, date_format: str, original_filename: str = None):
+    """
+    Merge FR sheet's two stacked tables by ['Appx.', 'Org Name']:
+      - Table 1 is preserved (columns/values untouched)
+      - Table 2 contributes 'Amount' and 'Committee Status'
+    Output columns (when present):
+      ['Appx.', 'Org Name', 'Request Type', 'Org Type (year)',
+       'Amount Requested', 'Amount', 'Committee Status',
+       'Funding Source', 'Primary Contact', 'Email Address', 'Date']
+
+    Args:
+        df: Input DataFrame
+        txt: Companion text (used for date extraction if original_filename not provided)
+        date_format: Date format string (e.g., "%m/%d/%Y")
+        original_filename: Optional original filename. If provided, output will be named
+                          "{original_filename} Cleaned" instead of "FR_clean_{date}"
+
+    Returns:
+        Dict[str, pd.DataFrame]: Dictionary with single key-value pair {out_name: processed_df}
+    """
+    out_name, out = _process_frame(df, txt, date_format, original_filename)
+    return {out_name: out}
 
 
 def FR_ProcessorV2_Multi(dfs_with_txt: list, date_format: str = "%Y-%m-%d", original_filenames: list = None):
@@ -279,7 +287,6 @@ def FR_ProcessorV2_Multi(dfs_with_txt: list, date_format: str = "%Y-%m-%d", orig
     for idx, pair in enumerate(dfs_with_txt):
         if not isinstance(pair, (tuple, list)) or len(pair) != 2:
             raise ValueError(f"Expected (df, txt) tuple at index {idx}, got {type(pair)}")
-
         df, txt = pair
 
         if not isinstance(df, pd.DataFrame):
@@ -288,10 +295,8 @@ def FR_ProcessorV2_Multi(dfs_with_txt: list, date_format: str = "%Y-%m-%d", orig
         # Get original filename if provided
         orig_name = original_filenames[idx] if original_filenames and idx < len(original_filenames) else None
 
-        # Process each file individually
-        result = FR_ProcessorV2(df, txt, date_format, original_filename=orig_name)
-
-        # Merge into the combined results dictionary
-        all_results.update(result)
+        # Process each file individually, keying its output straight into the combined results
+        out_name, out = _process_frame(df, txt, date_format, orig_name)
+        all_results[out_name] = out
 
     return all_results
\ No newline at end of file
@@ -36,6 +36,7 @@ class ASUCProcessor:
     def __init__(self, process_type: str):
         self.type = process_type.upper()
         self.logger = get_logger(self.type)
+        self._config = None # this type's entry in process_configs, resolved on first use
         self.processors = {
             "ABSA": self.absa,
             "OASIS": self.oasis,
@@ -83,22 +84,24 @@ class ASUCProcessor:
         }
         return ASUCProcessor.process_configs
 
+    def _type_config(self) -> Dict[str, Any]:
+        if self._config is None:
+            self._config = ASUCProcessor.get_process_configs().get(self.get_type())
+        return self._config
+
     def get_processing_func(self):
-        cfg = ASUCProcessor.get_process_configs()
-        return cfg.get(self.get_type()).get("Processing Function")
+        return self._type_config().get("Processing Function")
 
     def get_type(self) -> str:
         return self.type
 
     def get_file_naming(self, tag_type: str = "Clean") -> str:
-        cfg = ASUCProcessor.get_process_configs()
         if tag_type != "Clean":
             raise ValueError(f"Unknown tag type {tag_type}")
-        return cfg.get(self.get_type()).get("Clean File Name")
+        return self._type_config().get("Clean File Name")
 
     def get_name_dependency(self) -> str | None:
-        cfg = ASUCProcessor.get_process_configs()
-        return cfg.get(self.get_type()).get("Raw Name Dependency")
+        return self._type_config().get("Raw Name Dependency")
 
     def _log(self, msg: str, reporting: bool) -> None:
         if reporting:
@@ -108,11 +111,11 @@ class ASUCProcessor:
 
     def name_clean(self, names: Iterable[str], subst_name: str | None = None, reporting: bool = False) -> List[str]:
         out: List[str] = []
+        dep = self.get_name_dependency()
         for raw in names:
             assert isinstance(raw, str), "expected name to be a string"
             new = re.sub(r"\([\d]+\)", "", raw)
             new = new.replace(".gsheet", "").replace(".xlsx", "").replace(".csv", "").strip()
-            dep = self.get_name_dependency()
             if subst_name and dep:
                 new = new.replace(dep, subst_name)
             self._log(f"Cleaned name: '{raw}' -> '{new}'", reporting)
@@ -129,17 +132,18 @@ class ASUCProcessor:
 
         out_frames: List[pd.DataFrame] = []
         out_names: List[str] = []
+        fn = self.get_processing_func()
+        clean_name = self.get_file_naming()
 
         for df, name in zip(dfs, names):
             assert isinstance(df, pd.DataFrame), "expected a pandas DataFrame"
             try:
-                fn = self.get_processing_func()
                 processed = fn(df)
                 out_frames.append(processed)
-                out_names.append(self.get_file_naming())
+                out_names.append(clean_name)
                 self._log(f"[ABSA] Processed '{name}' via {fn.__name__}", reporting)
             except Exception as e:
-                self._log(f"Processing failed for {name}, processing function: {self.get_processing_func().__name__}) : {str(e)}", reporting)
+                self._log(f"Processing failed for {name}, processing function: {fn.__name__}) : {str(e)}", reporting)
                 raise e
         return out_frames, out_names
     
@@ -203,14 +207,15 @@ class ASUCProcessor:
 
         out_frames: List[pd.DataFrame] = []
         out_names: List[str] = []
+        fn = self.get_processing_func()
+        clean_name = self.get_file_naming()
 
         for df, name in zip(dfs, names):
             assert isinstance(df, pd.DataFrame), "expected a pandas DataFrame"
             try:
-                fn = self.get_processing_func()
                 processed = fn(df, year=year)
                 out_frames.append(processed)
-                out_names.append(self.get_file_naming())
+                out_names.append(clean_name)
                 self._log(f"[OASIS] Processed '{name}' via {fn.__name__}", reporting)
             except Exception as e:
                 self._log(f"[OASIS] Failed '{name}': {e}", reporting)
@@ -227,6 +232,7 @@ class ASUCProcessor:
 
         out_frames: List[pd.DataFrame] = []
         out_names: List[str] = []
+        fn = self.get_processing_func()  # FR_ProcessorV2
 
         for idx, pair in enumerate(dfs):
             if not isinstance(pair, (tuple, list)) or len(pair) != 2:
@@ -235,7 +241,6 @@ class ASUCProcessor:
             assert isinstance(df, pd.DataFrame), "expected a pandas DataFrame"
 
             try:
-                fn = self.get_processing_func()  # FR_ProcessorV2
                 produced: Dict[str, pd.DataFrame] = fn(df, txt, date_format="%Y-%m-%d")
                 for out_name, out_df in produced.items():
                     out_frames.append(out_df)
@@ -257,14 +262,15 @@ class ASUCProcessor:
 
         out_frames: List[pd.DataFrame] = []
         out_names: List[str] = []
+        fn = self.get_processing_func()
+        clean_name = self.get_file_naming()
 
         for df, name in zip(dfs, names):
             assert isinstance(df, pd.DataFrame), "expected a pandas DataFrame"
             try:
-                fn = self.get_processing_func()
                 processed = fn(df)
                 out_frames.append(processed)
-                out_names.append(self.get_file_naming())
+                out_names.append(clean_name)
                 self._log(f"[CONTINGENCY] Processed '{name}' via {fn.__name__}", reporting)
             except Exception as e:
                 self._log(f"[CONTINGENCY] Failed '{name}': {e}", reporting)
@@ -89,7 +89,9 @@ def Reconcile_FR_Agenda(fr_df: pd.DataFrame, agenda_df: pd.DataFrame) -> pd.Data
         agenda_subset,
         on='Org Name',
         how='outer',
-        indicator=True
+        indicator=True,
+        sort=False,
+        copy=False # both subsets are private copies made above
     )
 
     # Apply reconciliation logic: Agenda overrides FR
@@ -123,7 +125,7 @@ def Reconcile_FR_Agenda(fr_df: pd.DataFrame, agenda_df: pd.DataFrame) -> pd.Data
     # Apply business rule: Set Amount based on Committee Status and Request Type
     # - If not "Approved": set Amount to 0
     # - EXCEPT for Sponsorships that are Tabled/Denied: leave Amount as empty (NaN)
-    merged['Committee_Status_Final'] = merged['Committee_Status_Final'].fillna('')
+    merged['Committee_Status_Final'] = merged['Committee_Status_Final'].astype(object).fillna('') # the Agenda column is categorical, which has no '' category
     is_approved = merged['Committee_Status_Final'].astype(str).str.contains('Approved', case=False, na=False)
 
     # For non-approved items, set Amount to 0
@@ -188,7 +190,7 @@ def Reconcile_FR_Agenda(fr_df: pd.DataFrame, agenda_df: pd.DataFrame) -> pd.Data
 
     # Create a sort key column based on the defined order
     # Any Request Type not in the order dict gets a high number (sorted last)
-    result['_sort_key'] = result['Request Type'].map(request_type_order).fillna(999)
+    result['_sort_key'] = result['Request Type'].astype(object).map(request_type_order).fillna(999) # object first, a categorical map result has no 999 category
 
     # Sort by Request Type order first, then by Org Name
     result = result.sort_values(['_sort_key', 'Org Name']).reset_index(drop=True)
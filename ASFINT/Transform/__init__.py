@@ -1,5 +1,5 @@
 from .ABSA_Processor import *
-from .Agenda_Processor import Agenda_Processor
+from .Agenda_Processor import Agenda_Processor, Agenda_Processor_batch
 from .OASIS_Processor import OASIS_Abridged, year_adder, year_rank_collision_handler
 from .FR_Processor import FR_ProcessorV2
 from .Processor import ASUCProcessor
\ No newline at end of file
@@ -1,18 +1,40 @@
+import functools
 import pandas as pd
-import re
+import string
 
+_KEEP = frozenset(string.ascii_letters + string.digits + "_")
+_LEAD = frozenset(string.ascii_letters + "_")
+# Drop every disallowed ASCII codepoint in one C-level pass; spaces become underscores
+_TRANS = {i: None for i in range(128) if chr(i) not in _KEEP}
+_TRANS[ord(" ")] = ord("_")
+# DataFrame.attrs key tagging frames whose labels are already clean, holds the hash of the cleaned labels
+_CLEANED_ATTR = "_columns_cleaned"
+
+@functools.lru_cache(maxsize=8192)
 def clean_name(name: str) -> str:
-    # Replace spaces with underscores
-    name = name.replace(" ", "_")
-    # Remove special characters (allow only letters, numbers, underscores)
-    name = re.sub(r'[^a-zA-Z0-9_]', '', name)
+    """
+    Converts a column label into a BigQuery-safe name. Pure function of its input, so results are memoized:
+    labels repeated across dataframes (eg. 'Date', 'Amount') are only cleaned once.
+    """
+    # Replace spaces with underscores and remove special characters (allow only letters, numbers, underscores)
+    name = name.translate(_TRANS)
+    if not name.isascii():
+        # translate table only covers ASCII, drop anything outside it
+        name = "".join(c for c in name if c.isascii())
     # Ensure it starts with a letter or underscore
-    if not re.match(r'^[a-zA-Z_]', name):
+    if not name or name[0] not in _LEAD:
         name = "_" + name
     # Truncate to 300 characters
     return name[:300]
 
 def col_name_conversion(dfs) -> list[pd.DataFrame]:
+    """
+    Converts column labels of a dataframe or list of dataframes into BigQuery-safe names (see clean_name).
+
+    Inputs are never mutated: each output is produced with set_axis, which returns a new frame whose data
+    does not share writes with the input.
+    Outputs are tagged in df.attrs so passing an already converted frame back in returns it as is.
+    """
     if isinstance(dfs, pd.DataFrame):
         dfs = [dfs]
 
@@ -22,9 +44,13 @@ def col_name_conversion(dfs) -> list[pd.DataFrame]:
 
     cleaned_dfs = []
     for df in dfs:
-        cleaned_df = df.copy()
-        cleaned_df.columns = [clean_name(col) for col in df.columns]
+        if len(df.columns) == 0 or df.attrs.get(_CLEANED_ATTR) == hash(tuple(df.columns)):
+            # nothing to clean, or this frame already came out of col_name_conversion with its labels unchanged since
+            cleaned_dfs.append(df)
+            continue
+        # one Index.map over the memoized clean_name rather than an Index.str restatement of its rules, so they live in one place
+        cleaned_df = df.set_axis(df.columns.map(clean_name), axis=1)
+        cleaned_df.attrs[_CLEANED_ATTR] = hash(tuple(cleaned_df.columns))
         cleaned_dfs.append(cleaned_df)
 
     return cleaned_dfs
-
@@ -1,51 +1,26 @@
-from collections.abc import Iterable
+"""
+Rudimentary input checks used across ASFINT.
+
+Supported iterables: the checks here only treat list, tuple, set, frozenset, pd.Series, pd.Index and np.ndarray
+as iterables of values (see _CONCRETE_ITER). Strings are scalars, and other iterables (generators, dict views)
+should be converted to a list first.
+"""
+import numpy as np
 import pandas as pd
 
+_CONCRETE_ITER = (list, tuple, set, frozenset, pd.Series, pd.Index, np.ndarray)
+_INDEXABLE = (list, tuple, str, bytes, bytearray, pd.Series, pd.Index, np.ndarray)
+
 def is_valid_iter(inpt, exclude = None):
     """
-    Checks if a certain data type is a 'valid iterable' meaning that it belongs to the Iterable class and can be indexed.
+    Checks if a certain data type is a 'valid iterable' meaning that it is one of the indexable iterable types in _INDEXABLE.
     """
     if exclude is None:
-        return isinstance(inpt, Iterable) and hasattr(inpt, "__getitem__")
-    else:
-        if isinstance(exclude, Iterable):
-            return all(isinstance(inpt, Iterable) and hasattr(inpt, "__getitem__") and not isinstance(inpt, ex) for ex in exclude)
-        else:
-            return isinstance(inpt, Iterable) and hasattr(inpt, "__getitem__") and not isinstance(inpt, exclude)
-
-def _is_type(inpt, t, report):
-    # private function
-    """
-    Private helper function to check if an input is of a specified type or, if iterable, 
-    whether all elements belong to at least one specified type.
-
-    Args:
-        inpt: The input value or iterable of values to be checked.
-        t: A single type or an iterable of types to validate against.
+        return isinstance(inpt, _INDEXABLE)
+    if not isinstance(exclude, type):
+        exclude = tuple(exclude)
+    return isinstance(inpt, _INDEXABLE) and not isinstance(inpt, exclude)
 
-    Returns:
-        bool: True if `inpt` matches at least one of the specified types, 
-              or if `inpt` is an iterable and all its elements match at least one type in `t`. 
-              False otherwise.
-    """
-    def _is_type_helper(inpt, t, report):
-        """
-        Checks if the input is of a specified type `t` or, if an iterable, 
-        whether all elements in `inpt` are of type `t`.
-        """
-        if isinstance(inpt, Iterable) and len(inpt) == 0:
-            if report:
-                print(f"WARNING: Input is an empty iterable '{inpt}' but asked to check for type {t}.")
-            return False
-        return isinstance(inpt, t) or (isinstance(inpt, Iterable) and all(isinstance(x, t) for x in inpt)) # handles case where inpt is a string --> we return isinstance(inpt, t) before iterating through it
-    
-    if isinstance(t, Iterable):
-        if len(t) == 0:
-            raise ValueError(f"Iterable {t} passed in for types to check for but iterable was empty.")
-        return any(_is_type_helper(inpt, type, report) for type in t) #was previously all
-    else:
-        return _is_type_helper(inpt, t, report)
-    
 def is_type(inpt, t, report=False):
     """
     Public function to check if an input is of a specified type or, if iterable, 
@@ -76,19 +51,21 @@ def is_type(inpt, t, report=False):
         False
     """
     assert not isinstance(t, (str, bytes)), "'t' arg cannot be a string or bytes or else we iterate through individual characters"
-    if isinstance(t, Iterable):
-        t = tuple(t)
+    t = (t,) if isinstance(t, type) else tuple(t)
+    if __debug__: # argument validation only, compiled out under 'python -O' like the asserts
+        if len(t) == 0:
+            raise ValueError(f"Iterable {t} passed in for types to check for but iterable was empty.")
 
-    try:
-        if isinstance(inpt, t): # Direct type check: handles inpt and t both are not iterables
-            return True
-        elif any(isinstance(inpt, elem) for elem in t):
-            return True # Handles inpt not iterable, t iterable
-    except TypeError:  # Catch only type-related errors
-        return _is_type(inpt, t, report=report)
-    
-    if isinstance(inpt, Iterable): # Handles inpt iterable, t not iterable as well as both inpt and t iterable
-        return _is_type(inpt, t, report=report)
+    if isinstance(inpt, t): # Direct type check: handles inpt being one of the types in t
+        return True
+    if isinstance(inpt, _CONCRETE_ITER): # concrete types rather than the Iterable ABC, strings are deliberately excluded
+        if len(inpt) == 0:
+            if __debug__ and report:
+                for typ in t:
+                    print(f"WARNING: Input is an empty iterable '{inpt}' but asked to check for type {typ}.")
+            return False
+        return any(all(isinstance(x, typ) for x in inpt) for typ in t) # all elements must share one of the types in t
+    return False
     
 def in_df(inpt, df):
     """
@@ -116,9 +93,10 @@ def in_df(inpt, df):
     elif isinstance(inpt, int):
         assert inpt >= 0, 'integer inpt values must be non-negative.'
         return inpt < len(df.columns)
-    elif isinstance(inpt, Iterable):
+    elif isinstance(inpt, _CONCRETE_ITER):
         if isinstance(inpt[0], str):
-            return pd.Series(inpt).isin(df.columns).all()
+            cols = frozenset(df.columns) # build once so each membership check is O(1)
+            return all(c in cols for c in inpt)
         elif isinstance(inpt[0], int):
             return all(pd.Series(inpt) < len(df.columns))
     
@@ -142,25 +120,19 @@ def any_in_df(inpt, df):
         AssertionError: If `inpt` is not a string or an iterable of strings.
     """
     assert is_type(inpt, str), 'inpt must be string or iterable of strings.'
+    cols = frozenset(df.columns)
     if isinstance(inpt, str): 
-        return inpt in df.columns
-    elif isinstance(inpt, Iterable):
-        inpt = list(inpt)
-        return any(df.columns.isin(inpt))
+        return inpt in cols
+    elif isinstance(inpt, _CONCRETE_ITER):
+        return any(c in cols for c in inpt)
     
 def any_drop(df, cols):
     """
-    Drops any and all columns instantiated in the 'cols' arg from 'df' arg if they're present."""
+    Drops any and all columns instantiated in the 'cols' arg from 'df' arg if they're present, columns that aren't present are ignored."""
     assert isinstance(df, pd.DataFrame), f"Inputted 'df' should be a pandas dataframe,  but is {type(df)}"
-    if list(cols) != []:
-        assert is_type(cols, str), "'cols' must be a string or an iterable of strings."
-        assert any_in_df(cols, df), f"None of the columns in {cols} are present in the DataFrame."
-    else:
+    cols = [cols] if isinstance(cols, str) else list(cols)
+    if not cols:
         return df
-
-    if isinstance(cols, str):
-        cols_to_drop = [cols] if cols in df.columns else []
-    else:
-        cols_to_drop = [c for c in cols if c in df.columns]
-    return df.drop(columns=cols_to_drop)
-
+    if __debug__:
+        assert is_type(cols, str), "'cols' must be a string or an iterable of strings."
+    return df.drop(columns=cols, errors='ignore')
@@ -346,6 +346,49 @@ def heading_finder(df, start_col, start, nth_start = 0, shift = 0, start_logic =
     rv = rv.reset_index(drop=True)
     return rv
 
+def heading_finder_many(df, specs, start_col = 0, end = 'SUBTOTAL', drop_null_cols = False) -> list[pd.DataFrame]:
+    """
+    Batch version of heading_finder for many sections of the same df.
+    Each (start, shift) pair in 'specs' gives the same frame as
+    heading_finder(df, start_col, start, shift=shift, end=end, start_logic='exact', end_logic='contains'),
+    but 'start_col' is stripped and searched once for every spec instead of once per call.
+
+    Parameters:
+    - df (pd.DataFrame): The input DataFrame.
+    - specs (iterable of (str, int)): (start, shift) pairs, one per section to extract. Uses the first occurence of each 'start'.
+    - start_col (str or int): Column index or name holding both the 'start' headers and the 'end' values.
+    - end (str): Value that ends a section, matched with 'contains' logic. The row holding it is excluded.
+    - drop_null_cols (bool): If True, columns whose header cell is null are left out of each section.
+
+    Returns:
+    - list[pd.DataFrame]: One section per spec, in order.
+    """
+    assert isinstance(start_col, str) or isinstance(start_col, int), "'start_col' must be index of column or name of column."
+    assert in_df(start_col, df), 'Given start_col is not in the given df.'
+
+    col = df.iloc[:, df.columns.get_loc(start_col) if isinstance(start_col, str) else start_col]
+    first_idx = {}
+    for i, val in enumerate(col.astype(str).str.strip().to_numpy()):
+        first_idx.setdefault(val, i)
+    end_idx = np.flatnonzero(col.fillna('').astype(str).str.contains(str(end), regex=False).to_numpy())
+
+    sections = []
+    for start, shift in specs:
+        if start not in first_idx:
+            raise ValueError(f"Header '{start}' not found in column '{start_col}'.")
+        start_index = first_idx[start] + shift
+        if start_index >= len(df):
+            raise ValueError("Shifted start index exceeds DataFrame length.")
+        nxt = np.searchsorted(end_idx, start_index) # first end row at or after the section's header row
+        if nxt == len(end_idx):
+            raise ValueError(f"End value '{end}' not found in column '{start_col}'.")
+        header = pd.Index(df.iloc[start_index].values)
+        keep = np.flatnonzero(~header.isna()) if drop_null_cols else slice(None)
+        section = df.iloc[start_index + 1:end_idx[nxt], keep].reset_index(drop=True) # one take for rows and columns
+        section.columns = header[keep]
+        sections.append(section)
+    return sections
+
 def ending_keyword_adder(df, given_start = 'Appx', start_col = 0, adding_end_keyword='END', end_col = 0, alphabet=None, reporting=False) -> pd.DataFrame:
     """Non-mutatively adds 'end_keyword' to signify end of a section for FR documents. Also shifts the dataframe down and updates the columns."""
     assert isinstance(start_col, str) or isinstance(start_col, int), "'start_col' must be index of column or name of column."
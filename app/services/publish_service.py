@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
@@ -36,6 +37,33 @@ class WarehousePublisher(ABC):
         """Persist a cleaned DataFrame and return publish metadata."""
 
 
+def _copy_field(value: Any) -> str:
+    """Formats one value for COPY ... WITH CSV. NULL is the bare empty field; every other value is quoted, so '' stays ''."""
+    if value is None:
+        return ""
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _copy_insert(table, conn, keys, data_iter) -> None:
+    """pandas.to_sql insertion method that loads all rows with one PostgreSQL COPY instead of batched INSERTs."""
+    buf = io.StringIO()
+    for row in data_iter:
+        buf.write(",".join(_copy_field(value) for value in row))
+        buf.write("\n")
+    buf.seek(0)
+
+    columns = ", ".join(f'"{key}"' for key in keys)
+    target = f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+    statement = f"COPY {target} ({columns}) FROM STDIN WITH CSV"
+
+    with conn.connection.cursor() as cur:
+        if hasattr(cur, "copy_expert"):  # psycopg2
+            cur.copy_expert(statement, buf)
+        else:  # psycopg 3
+            with cur.copy(statement) as copy:
+                copy.write(buf.getvalue())
+
+
 class PostgreSQLWarehousePublisher(WarehousePublisher):
     def __init__(self, engine: Engine | None = None, schema: str | None = None):
         self.engine = engine or default_engine
@@ -55,7 +83,7 @@ class PostgreSQLWarehousePublisher(WarehousePublisher):
             schema=self.schema,
             if_exists="replace",
             index=False,
-            method="multi",
+            method=_copy_insert if self.engine.dialect.name == "postgresql" else "multi",
         )
         return (
             table_name,
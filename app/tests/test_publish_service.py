@@ -1,4 +1,5 @@
 from pathlib import Path
+from types import SimpleNamespace
 
 import pandas as pd
 import pytest
@@ -8,7 +9,7 @@ from sqlalchemy.orm import sessionmaker
 
 from app.core.database import Base
 from app.core.models import Dataset, Ingestion
-from app.services.publish_service import PostgreSQLWarehousePublisher, PublishService
+from app.services.publish_service import PostgreSQLWarehousePublisher, PublishService, _copy_insert
 
 
 @pytest.fixture
@@ -131,3 +132,49 @@ def test_publish_rejects_non_clean_ready_ingestion(db, tmp_path):
         service.publish(ingestion.id)
 
     assert exc.value.status_code == 409
+
+
+class _FakeCursor:
+    def __init__(self):
+        self.statement = None
+        self.payload = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def copy_expert(self, statement, buf):
+        self.statement = statement
+        self.payload = buf.read()
+
+
+def test_copy_insert_keeps_empty_strings_apart_from_nulls():
+    cursor = _FakeCursor()
+    conn = SimpleNamespace(connection=SimpleNamespace(cursor=lambda: cursor))
+    table = SimpleNamespace(schema="finance", name="Budget_v1")
+    rows = [
+        ("A", None, 100),
+        ("", "x", None),
+        ('say "hi"', "line1\nline2", 2.5),
+    ]
+
+    _copy_insert(table, conn, ["Org_Name", "Note", "Amount"], iter(rows))
+
+    assert cursor.statement == 'COPY "finance"."Budget_v1" ("Org_Name", "Note", "Amount") FROM STDIN WITH CSV'
+    assert cursor.payload == (
+        '"A",,"100"\n'
+        '"","x",\n'
+        '"say ""hi""","line1\nline2","2.5"\n'
+    )
+
+
+def test_copy_insert_unqualified_table():
+    cursor = _FakeCursor()
+    conn = SimpleNamespace(connection=SimpleNamespace(cursor=lambda: cursor))
+
+    _copy_insert(SimpleNamespace(schema=None, name="t"), conn, ["a"], iter([(1,)]))
+
+    assert cursor.statement == 'COPY "t" ("a") FROM STDIN WITH CSV'
+    assert cursor.payload == '"1"\n'
@@ -0,0 +1,52 @@
+import unittest
+
+import pandas as pd
+
+from ASFINT.Utility.BQ_Helpers import *
+
+class TestCleanName(unittest.TestCase):
+    def test_clean_name(self):
+        self.assertEqual(clean_name("Org Name"), "Org_Name")
+        self.assertEqual(clean_name("1 Amount ($)"), "_1_Amount_") # leading digit gets an underscore prefix
+        self.assertEqual(clean_name("Café"), "Caf") # non-ascii characters are dropped
+        self.assertEqual(clean_name(""), "_")
+        self.assertEqual(len(clean_name("a" * 400)), 300)
+
+class TestColNameConversion(unittest.TestCase):
+    def test_matches_clean_name(self):
+        df = pd.DataFrame({"1 Amount ($)": [1], "Org Name": [2], "": [3], "Café": [4]})
+        result = col_name_conversion(df)[0]
+        self.assertEqual(list(result.columns), [clean_name(c) for c in df.columns])
+        self.assertEqual(list(df.columns), ["1 Amount ($)", "Org Name", "", "Café"]) # input is left untouched
+
+    def test_output_does_not_share_data(self):
+        df = pd.DataFrame({"A B": [1, 2]})
+        result = col_name_conversion(df)[0]
+        result.iloc[0, 0] = 99
+        self.assertEqual(df.iloc[0, 0], 1) # writes to the output don't reach the input
+
+    def test_single_implementation(self):
+        names = ["Amount ($) - FY25!", "Total, Req'd", "Café Ünion", "Ñandú", "2024 Budget", "9", "ABSA #1 / Appx"]
+        result = col_name_conversion(pd.DataFrame({n: [i] for i, n in enumerate(names)}))[0]
+        self.assertEqual(list(result.columns), [clean_name(n) for n in names])
+        self.assertEqual(list(result.columns),
+                         ["Amount___FY25", "Total_Reqd", "Caf_nion", "and", "_2024_Budget", "_9", "ABSA_1__Appx"])
+
+    def test_list_input(self):
+        dfs = [pd.DataFrame({"A B": [1]}), pd.DataFrame({"C-D": [2]})]
+        result = col_name_conversion(dfs)
+        self.assertEqual([list(df.columns) for df in result], [["A_B"], ["CD"]])
+
+    def test_already_cleaned_passthrough(self):
+        cleaned = col_name_conversion(pd.DataFrame({"A B": [1]}))[0]
+        self.assertIs(col_name_conversion(cleaned)[0], cleaned)
+        cleaned.columns = ["C D"] # relabelled after cleaning so it has to be cleaned again
+        self.assertEqual(list(col_name_conversion(cleaned)[0].columns), ["C_D"])
+
+if __name__ == '__main__':
+    clean_name_tests = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestCleanName))
+    if clean_name_tests.wasSuccessful():
+        print("✅ All clean_name tests passed successfully!")
+    conversion_tests = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestColNameConversion))
+    if conversion_tests.wasSuccessful():
+        print("✅ All col_name_conversion tests passed successfully!")
@@ -174,6 +174,11 @@ class TestAnyDrop(unittest.TestCase):
         with self.assertRaises(AssertionError):
             any_drop(self.sample_df, ["A", 123, None, "C"])
 
+    def test_anydrop_none_present(self):
+        """Test when none of the columns in cols are present."""
+        result = any_drop(self.sample_df, ["X", "Y"])
+        self.assertEqual(list(result.columns), ["A", "B", "C"])
+
     def test_anydrop_empty_list(self):
         """Test when cols is an empty list."""
         result = any_drop(self.sample_df, [])
@@ -0,0 +1,49 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+import ASFINT.Push.pushers as pushers
+from ASFINT.Push.pushers import *
+
+class TestPushCsv(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.rows = pushers._ARROW_MIN_ROWS + 500 # large enough for the Arrow path
+
+    def assert_matches_to_csv(self, df, arrow_used):
+        with mock.patch.object(pushers._pcsv, "write_csv", wraps=pushers._pcsv.write_csv) as write_csv:
+            push_csv(df, "out", self.tmp.name)
+        self.assertEqual(write_csv.called, arrow_used)
+        expected = df.to_csv(index=False, lineterminator="\n").encode("utf-8")
+        self.assertEqual((Path(self.tmp.name) / "out.csv").read_bytes(), expected)
+
+    def test_arrow_path_matches_to_csv(self):
+        n = self.rows
+        df = pd.DataFrame({
+            "Org Name": [f"Club {i} é" for i in range(n)],
+            "Amount": range(n),
+            "Note": ["", None, " padded ", "x"] * (n // 4),
+            "Count": pd.array([1, None] * (n // 2), dtype="Int64"),
+            "Empty": [None] * n,
+        })
+        self.assert_matches_to_csv(df, arrow_used=True)
+
+    def test_values_needing_quotes_fall_back(self):
+        n = self.rows
+        df = pd.DataFrame({"Org Name": ["a,b", 'say "hi"', "line\nbreak", "x\ry"] * (n // 4), "Amount": range(n)})
+        self.assert_matches_to_csv(df, arrow_used=True) # Arrow refuses the first batch, to_csv rewrites the file
+
+    def test_other_dtypes_use_to_csv(self):
+        n = self.rows
+        self.assert_matches_to_csv(pd.DataFrame({"Org Name": ["a"] * n, "Amount": [1.0] * n}), arrow_used=False)
+        self.assert_matches_to_csv(pd.DataFrame({"Org Name": ["", "a"] * (n // 2)}), arrow_used=False) # single column
+        self.assert_matches_to_csv(pd.DataFrame({"Org Name": ["a"] * 10, "Amount": range(10)}), arrow_used=False) # small
+
+if __name__ == '__main__':
+    push_tests = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestPushCsv))
+    if push_tests.wasSuccessful():
+        print("✅ All push_csv tests passed successfully!")
@@ -0,0 +1,55 @@
+import unittest
+from io import StringIO
+from contextlib import redirect_stdout
+
+import pandas as pd
+
+from ASFINT.Transform.Reconciliation_Processor import Reconcile_FR_Agenda
+
+def _agenda():
+    # same dtypes Agenda_Processor returns: categorical labels and a nullable float Amount
+    rv = pd.DataFrame({
+        'Org Name': ['Helix @ Berkeley', 'Chess Club', 'Dance Team'],
+        'Request Type': ['Contingency', 'Sponsorship', 'Contingency'],
+        'Amount': [100.0, None, 50.0],
+        'Committee Status': ['Approved', 'Tabled', 'Denied'],
+        'Date': ['2025-03-03'] * 3,
+    })
+    for col in ('Request Type', 'Committee Status', 'Date'):
+        rv[col] = rv[col].astype('category')
+    rv['Amount'] = rv['Amount'].astype('Float64')
+    return rv
+
+class TestReconcileCategoricalAgenda(unittest.TestCase):
+    def reconcile(self, fr):
+        with redirect_stdout(StringIO()):
+            return Reconcile_FR_Agenda(fr, _agenda())
+
+    def test_fr_without_status_columns(self):
+        # FR-only rows leave the categorical agenda columns missing, which the fills must handle
+        fr = pd.DataFrame({'Org Name': ['Helix @ Berkeley', 'Robotics'], 'Request Type': ['Contingency', 'Finance Rule']})
+        result = self.reconcile(fr).set_index('Org Name')
+        self.assertEqual(result.loc['Robotics', 'Committee Status'], '')
+        self.assertEqual(result.loc['Robotics', 'Amount'], 0)
+        self.assertEqual(result.loc['Helix @ Berkeley', 'Committee Status'], 'Approved')
+        self.assertEqual(result.loc['Helix @ Berkeley', 'Amount'], 100)
+        self.assertTrue(pd.isna(result.loc['Chess Club', 'Amount'])) # tabled sponsorship stays empty
+        self.assertEqual(result.loc['Dance Team', 'Amount'], 0)
+
+    def test_fr_with_status_columns(self):
+        fr = pd.DataFrame({
+            'Org Name': ['Helix @ Berkeley', 'Robotics'],
+            'Request Type': ['Contingency', 'Space Reservation'],
+            'Amount': [80.0, 20.0],
+            'Committee Status': ['Tabled indefinitely', 'Approved'],
+        })
+        result = self.reconcile(fr)
+        self.assertEqual(list(result['Org Name']), ['Dance Team', 'Helix @ Berkeley', 'Robotics', 'Chess Club'])
+        result = result.set_index('Org Name')
+        self.assertEqual(result.loc['Helix @ Berkeley', 'Committee Status'], 'Approved') # agenda wins
+        self.assertEqual(result.loc['Robotics', 'Amount'], 20)
+
+if __name__ == '__main__':
+    reconcile_tests = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestReconcileCategoricalAgenda))
+    if reconcile_tests.wasSuccessful():
+        print("✅ All reconciliation tests passed successfully!")
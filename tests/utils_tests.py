@@ -547,6 +547,34 @@ class TestHeadingFinder(unittest.TestCase):
         with self.assertRaises(ValueError):
             heading_finder(self.df, start_col='A', start='Header1', end_col='A', end='NonExistentEnd')
 
+class TestHeadingFinderMany(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'A': ['Sec1', 'Name', 'a', 'b', 'SUBTOTAL 1', ' Sec2 ', 'c', 'SUBTOTAL 2'],
+            'B': [None, 'Amt', 1, 2, 3, 'Amt', 4, 5],
+            'C': [None, None, 'x', 'y', 'z', None, 'w', 'v']
+        })
+
+    def test_matches_heading_finder(self):
+        specs = [('Sec1', 1), ('Sec2', 0)]
+        results = heading_finder_many(self.df, specs, start_col=0, end='SUBTOTAL')
+        for (start, shift), result in zip(specs, results):
+            expected = heading_finder(self.df, start_col=0, start=start, shift=shift, end='SUBTOTAL', start_logic='exact', end_logic='contains')
+            pd.testing.assert_frame_equal(result, expected)
+
+    def test_drop_null_cols(self):
+        result = heading_finder_many(self.df, [('Sec1', 1)], drop_null_cols=True)[0]
+        self.assertEqual(list(result.columns), ['Name', 'Amt'])
+        self.assertEqual(list(result['Name']), ['a', 'b'])
+
+    def test_start_not_found(self):
+        with self.assertRaises(ValueError):
+            heading_finder_many(self.df, [('Missing', 0)])
+
+    def test_end_not_found(self):
+        with self.assertRaises(ValueError):
+            heading_finder_many(self.df, [('Sec1', 0)], end='NonExistentEnd')
+
 class TestEndingKeywordAdder(unittest.TestCase):
     def setUp(self):
         self.df_base = pd.DataFrame({
@@ -615,6 +643,9 @@ if __name__ == '__main__':
     heading_finder_tests = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestHeadingFinder))
     if heading_finder_tests.wasSuccessful():
         print("✅ All heading_finder tests passed successfully!")
+    heading_finder_many_tests = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestHeadingFinderMany))
+    if heading_finder_many_tests.wasSuccessful():
+        print("✅ All heading_finder_many tests passed successfully!")
     # end_keyword_tests = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestEndingKeywordAdder))
     # if end_keyword_tests.wasSuccessful():
     #     print("✅ All ending_keyword_adder tests passed successfully!")
\ No newline at end of file
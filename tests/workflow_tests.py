@@ -0,0 +1,94 @@
+import filecmp
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from io import StringIO
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+import ASFINT.Pipeline.workflow as workflow
+from ASFINT.Pipeline.workflow import *
+
+_FR_SAMPLE = Path(__file__).resolve().parent.parent / "files" / "input" / "CLEAN - FR 24_25 F1 - Cleaned_Raw.csv"
+
+class _SlowProcessor:
+    """Stands in for ASUCProcessor: earlier files take longer, so a pool finishes them out of order."""
+    def dispatch(self, files, names, reporting=False):
+        (file,), (name,) = list(files), list(names)
+        time.sleep(0.01 * (5 - file))
+        return [file * 10], [f"clean {name}"]
+
+class TestRun(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def test_matches_serial_path(self):
+        pull_path = self.tmp / "in"
+        pull_path.mkdir()
+        for i in range(3):
+            shutil.copy(_FR_SAMPLE, pull_path / f"FR 24_25 F{i + 1}.csv")
+        with redirect_stdout(StringIO()):
+            run(str(pull_path), str(self.tmp / "pipelined"), "FR", max_workers=2)
+            push(process(pull(str(pull_path), "FR"), "FR"), str(self.tmp / "serial"), "FR")
+        serial = sorted(os.listdir(self.tmp / "serial"))
+        self.assertTrue(serial)
+        self.assertEqual(sorted(os.listdir(self.tmp / "pipelined")), serial)
+        for name in serial:
+            self.assertTrue(filecmp.cmp(self.tmp / "pipelined" / name, self.tmp / "serial" / name, shallow=False), name)
+
+class TestBackground(unittest.TestCase):
+    def test_producer_exception_reaches_consumer(self):
+        def pairs():
+            yield ("a", 1)
+            yield ("b", 2)
+            raise ValueError("bad file")
+
+        seen = []
+        with self.assertRaisesRegex(ValueError, "bad file"):
+            for pair in workflow._background(pairs()):
+                seen.append(pair)
+        self.assertEqual(seen, [("a", 1), ("b", 2)])
+
+    def test_abandoning_stops_reader(self):
+        produced = []
+
+        def pairs(): # endless reader, only stops if _background stops pulling from it
+            i = 0
+            while True:
+                produced.append(i)
+                yield (str(i), i)
+                i += 1
+
+        def consume():
+            stream = workflow._background(pairs(), maxsize=2)
+            next(stream)
+            stream.close() # consumer quits after the first file
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        consumer.join(timeout=5)
+        self.assertFalse(consumer.is_alive(), "closing the stream did not return")
+        count = len(produced)
+        time.sleep(0.05)
+        self.assertEqual(len(produced), count) # the reader thread is no longer pulling
+        self.assertLessEqual(count, 5) # bounded by the queue, not the (endless) input
+
+class TestProcessIter(unittest.TestCase):
+    def test_pool_keeps_input_order(self):
+        files = [(f"f{i}", i) for i in range(5)]
+        with mock.patch.object(workflow, "get_pFuncs", return_value=_SlowProcessor()):
+            serial = list(process_iter(files, "FR"))
+            pooled = list(process_iter(files, "FR", max_workers=3))
+        self.assertEqual(serial, [(f"clean f{i}", i * 10) for i in range(5)])
+        self.assertEqual(pooled, serial)
+
+if __name__ == '__main__':
+    for case in (TestRun, TestBackground, TestProcessIter):
+        result = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(case))
+        if result.wasSuccessful():
+            print(f"✅ All {case.__name__} tests passed successfully!")